@@ -0,0 +1,123 @@
+import os
+import json
+import mmap
+import zlib
+import numpy
+
+
+class Archive:
+    """
+    Archive of the raw per-sample series of the collectors. The samples of
+    all series are appended to a single data file in chunks, each of them
+    zlib-compressed unless that doesn't make it smaller, and an index records
+    where the chunks of every series are:
+
+        <directory>/series.dat
+        <directory>/index.jsonl
+
+    Series are keyed by (run, OS, page, browser, collector, iteration) and
+    their name. Loading a series memory-maps the data file and only decodes
+    that series' chunks, uncompressed chunks are returned as NumPy arrays
+    backed by the mapping without any copy.
+    """
+
+    _chunk_samples = 65536
+    _alignment = 8
+    key_fields = ["run", "os", "page", "browser", "collector", "iteration"]
+
+    def __init__(self, directory):
+        self._directory = directory
+        self._data_path = os.path.join(directory, "series.dat")
+        self._index_path = os.path.join(directory, "index.jsonl")
+        self._entries = None
+        self._map = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def append(self, key, series):
+        """
+        Adds the series, a dict of names to 1-D arrays, of the iteration key.
+        """
+        if not series:
+            return
+
+        entries = []
+
+        with open(self._data_path, "ab") as f:
+            for name, values in sorted(series.items()):
+                values = numpy.ascontiguousarray(values, dtype=float)
+                chunks = []
+
+                for start in range(0, len(values), self._chunk_samples):
+                    chunks.append(self._write_chunk(f, values[start:start + self._chunk_samples]))
+
+                entry = dict(zip(self.key_fields, key))
+                entry.update({"name": name, "dtype": values.dtype.str, "length": len(values), "chunks": chunks})
+                entries.append(entry)
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        # the index is only updated once the data is on disk
+        with open(self._index_path, "a") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+
+        if self._entries is not None:
+            self._entries.extend(entries)
+
+    def find(self, name=None, **key):
+        """
+        Returns the index entries of the series matching name and the given
+        key fields, e.g. find("Processor Watt", page="www.google.com").
+        """
+        return [entry for entry in self.entries()
+                if (name is None or entry["name"] == name) and all(entry[field] == value for field, value in key.items())]
+
+    def entries(self):
+        if self._entries is None:
+            self._entries = []
+
+            if os.path.exists(self._index_path):
+                with open(self._index_path) as f:
+                    self._entries = [json.loads(line) for line in f if line.endswith("\n")]
+
+        return self._entries
+
+    def load(self, entry):
+        """
+        Returns the samples of the series of an index entry.
+        """
+        dtype = numpy.dtype(entry["dtype"])
+        data = self._mapping(max(offset + size for offset, size, codec, count in entry["chunks"]) if entry["chunks"] else 0)
+        parts = []
+
+        for offset, size, codec, count in entry["chunks"]:
+            if codec == "raw":
+                parts.append(numpy.frombuffer(data, dtype=dtype, count=count, offset=offset))
+            else:
+                parts.append(numpy.frombuffer(zlib.decompress(data[offset:offset + size]), dtype=dtype, count=count))
+
+        if len(parts) == 1:
+            return parts[0]
+
+        return numpy.concatenate(parts) if parts else numpy.empty(0, dtype=dtype)
+
+    def _write_chunk(self, f, values):
+        raw = values.tobytes()
+        compressed = zlib.compress(raw)
+        codec, payload = ("zlib", compressed) if len(compressed) < len(raw) else ("raw", raw)
+
+        # raw chunks are aligned so that they can be viewed in place
+        offset = f.tell()
+        padding = -offset % self._alignment
+        f.write(b"\0" * padding)
+        f.write(payload)
+        return [offset + padding, len(payload), codec, len(values)]
+
+    def _mapping(self, size):
+        if self._map is None or len(self._map) < size:
+            with open(self._data_path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return self._map
@@ -1,79 +1,351 @@
 import os
+import copy
+import shutil
+import tempfile
 import argparse
 import json
 import platform
 import zmq
 import time
 import sys
-import pickle
+import uuid
+import inspect
+import threading
+import collections
+import protocol
+import pageset
+import cgroup
 
 from wrappers.PowerGadget import PowerGadget
 from wrappers.BLA import BLA
 from wrappers.IPPET import IPPET
+from wrappers.RAPL import RAPL
+from wrappers.ProcStat import ProcStat
 from browser import Browser
 from time import sleep
 from pandas import DataFrame, concat
 from dispatcher import Dispatcher
+from wrapper import Wrapper, CollectorGroup
+from warmup import Warmup
+from cache import ArtifactCache
+from overhead import Overhead
+from journal import Journal
+from store import ResultStore
+from replay import ReplayServer
 
 
 class Benchmark:
+    _collectors = {"PowerGadget": PowerGadget, "BLA": BLA, "IPPET": IPPET, "RAPL": RAPL, "ProcStat": ProcStat}
+
     def __init__(self, args):
         self._args = args
+        self._sessions = {}
+        self._journal = None
+        self._done = set()
+        self._cgroup = None
+        self._env = None
+        self.iterations = None
 
         with open(args.config) as f:
             self._config = json.load(f)
 
+        self._config["Pages"] = pageset.resolve(self._config["Pages"], args.config)
+
     def log(self):
+        """
+        Runs every (page, browser) cell, recording the results of every
+        collector in the journal as soon as they are complete. With --resume
+        the collectors recorded by an interrupted run are skipped and the
+        final table is assembled from the journal.
+        """
+        if any(browser.get("reuse", False) for browser in self._get_browsers()):
+            # visit all pages in a row with every browser to reuse its session
+            cells = [(page, browser) for browser in self._get_browsers() for page in self._get_pages()]
+        else:
+            cells = [(page, browser) for page in self._get_pages() for browser in self._get_browsers()]
+
+        self._journal = Journal(self._args.journal, {"config": Journal.digest(self._config), "mode": "local"})
+        records = self._journal.open(self._args.resume)
+        self._done = set((record["cell"][0], record["cell"][1], name) for record in records for name in record["cell"][2])
+
+        if records:
+            print("Resuming from {} journaled result(s)".format(len(records)))
+
+        if getattr(self._args, "concurrency", 1) > 1:
+            self._run_concurrent(cells)
+
+        # the package-level collectors, or all of them without concurrent sessions
+        for page, browser in cells:
+            if all((page, browser["name"], benchmark) in self._done for benchmark in self._get_benchmarks()):
+                continue
+
+            self._run_iteration(None, page, browser)
+
+        self._close_sessions()
+        self._stop_replay()
+        return self._assemble(self._journal.replay())
+
+    def remove_journal(self):
+        """
+        Removes the journal, once its results are safely written elsewhere.
+        """
+        if self._journal is not None:
+            self._journal.remove()
+
+    def _run_concurrent(self, cells):
+        """
+        Runs the cells in --concurrency parallel sessions, each in a cgroup
+        slice pinned to its own share of the CPUs. Only the collectors which
+        attribute their metrics to the session's processes run concurrently,
+        the package-level ones are left to the sequential pass.
+        """
+        if platform.system() != "Linux":
+            raise Exception("Concurrent sessions need cgroup v2 on Linux")
+
+        benchmarks = [benchmark for benchmark in self._get_benchmarks()
+                      if not getattr(Benchmark._collectors.get(benchmark), "_package_level", False)]
+        queue = collections.deque((page, browser) for page, browser in cells
+                                  if any((page, browser["name"], benchmark) not in self._done for benchmark in benchmarks))
+
+        if not queue:
+            return
+
+        if any(browser.get("reuse", False) for browser in self._get_browsers()):
+            print("Warning: browser sessions are not reused by concurrent sessions")
+
+        slices = [cgroup.Slice("session-{}".format(i), cpus, self._args.cgroup_root)
+                  for i, cpus in enumerate(cgroup.partition(cgroup.cpus(), self._args.concurrency))]
+        sessions = [SessionBenchmark(self, slice, benchmarks) for slice in slices]
+        threads = [threading.Thread(target=session.run, args=(queue,)) for session in sessions]
+        print("Running {} cell(s) in {} concurrent sessions".format(len(queue), len(sessions)))
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+        finally:
+            for session in sessions:
+                session.close()
 
-        if self._args.collect_interval:  # if user elected to store interval data, create directory
-            if platform.system() == "Windows":
-                directory = os.getcwd() + "\\" + self._args.interval_directory
-            else:
-                directory = os.getcwd() + "/" + self._args.interval_directory
+    def _run_iteration(self, df, page, browser):
+        config, browser = browser, self._launch_browser(page, browser)
+        partial = None
+        collectors = []
 
-            self._args.directory = directory
+        for benchmark in self._get_benchmarks():
+            if (page, config["name"], benchmark) in self._done:
+                continue
 
             try:
-                os.stat(directory)
+                collectors.append(Benchmark._create_benchmark(benchmark, self._args, browser.get_name(), page))
+            except Exception:
+                print("Warning: benchmark {} not supported".format(benchmark))
+                self._record(page, config, [benchmark], None, None)
+
+        if self._args.group_collectors:
+            collectors = CollectorGroup.schedule(collectors, self._config.get("Exclusive", []))
+
+        for benchmark in collectors:
+            try:
+                summary = self._run_benchmark(benchmark, browser)
             except:
-                os.mkdir(directory)  # creates the directory in which all IPPET data will be saved
+                print("Warning: benchmark {} failed".format(benchmark.get_name()))
+                continue
 
-        df = None
-        for page in self._get_pages():
-            for browser in self._get_browsers():
-                df = self._run_iteration(df, page, browser)
+            self._record(page, config, benchmark.get_names(), summary, self._iteration_rows(benchmark, summary))
+            partial = summary if partial is None else partial.combine_first(summary)
 
-        return df.sort(['OS', 'Page', 'Browser'])
+        self._release_browser(browser, config)
+        return partial if df is None else concat([df, partial])
 
-    def _run_iteration(self, df, page, browser):
-        if 'url' not in browser:
-            browser['url'] = ''
-        browser = Browser.create_browser(name=browser["name"], path=browser["path"], page=page, installURL=browser["url"])
-        args.image = os.path.basename(browser.get_path())
-        browser.initialize()
-        partial = None
+    def _record(self, page, config, names, summary, iterations):
+        """
+        Journals the results of the collectors names in a (page, browser) cell,
+        a summary of None records collectors that can't run here.
+        """
+        if self._journal is None:
+            return
+
+        self._journal.append({"cell": [page, config["name"], names],
+                              "summary": None if summary is None else Benchmark._to_records(summary)[0],
+                              "iterations": [] if iterations is None else Benchmark._to_records(iterations)})
+        self._done.update((page, config["name"], name) for name in names)
+
+    def _assemble(self, records):
+        """
+        Builds the final table from the journal in a single pass, the
+        summaries of the collectors of a cell are merged into one row with the
+        same precedence as the collectors' order in the configuration.
+        """
+        order = self._get_benchmarks()
+        rows = collections.OrderedDict()
+        iterations = []
+
+        for record in sorted(records, key=lambda record: min(order.index(name) if name in order else len(order)
+                                                             for name in record["cell"][2])):
+            if record["summary"] is not None:
+                row = rows.setdefault(tuple(record["cell"][:2]), {})
+
+                for key, value in record["summary"].items():
+                    row.setdefault(key, value)
+
+            iterations.extend(record["iterations"])
+
+        self.iterations = DataFrame(iterations) if iterations else None
+        return DataFrame(list(rows.values())).sort(['OS', 'Page', 'Browser']) if rows else None
 
-        sleep(self._args.sleep)
+    @staticmethod
+    def _to_records(df):
+        return [dict(zip(df.columns, row)) for row in df.values]
+
+    def _run_shard(self, page, browser, collector, start, stop):
+        """
+        Runs the iterations [start, stop) of a single collector and returns
+        their partial aggregate, see Wrapper.partial. The warm-up and launch
+        spans are sent apart from the iterations, they are added to the cell
+        once summarized.
+        """
+        config, browser = browser, self._launch_browser(page, browser)
+
+        try:
+            benchmark = Benchmark._create_benchmark(collector, self._args, browser.get_name(), page)
+            partial = Wrapper.partial(benchmark.log_partial(start, stop))
+            partial["launch"] = {'Warm-up': self._warmup}
+            partial["launch"].update(self._launch)
+            return partial
+        except:
+            print("Warning: benchmark {} not supported".format(collector))
+            return Wrapper.partial(DataFrame())
+        finally:
+            self._release_browser(browser, config)
+
+    def _launch_browser(self, page, browser):
+        """
+        Opens page in a fresh browser, or in the running session of the browser
+        when its configuration sets "reuse". Sessions of other browsers are
+        closed first so that only one browser is measured at a time.
+        """
+        session = self._sessions.pop(browser["name"], None)
+        self._close_sessions()
+        overhead = Overhead()
+        url = self._get_url(page)
+
+        with overhead.span("Launch"):
+            if session is not None and session.is_running():
+                print("Reusing {} session for {}".format(browser["name"], page))
+                session.navigate(url)
+                browser = session
+            else:
+                if session is not None:
+                    session.finalize()
+
+                if 'url' not in browser:
+                    browser['url'] = ''
+                build = browser.get("build")
+                browser = Browser.create_browser(name=browser["name"], path=browser["path"], page=url, installURL=browser["url"],
+                                                 cache=self._get_cache())
+                browser.build = build
+                browser.cgroup = self._cgroup
+                browser.env = self._env
+                browser.initialize()
+
+        self._launch = overhead.pop_spans()
+        self._args.image = os.path.basename(browser.get_path())
+        self._args.page = page
+        self._args.browser = browser.get_name()
+        self._warmup = Warmup(self._args).wait()
+
+        self._args.browser_pid = browser.get_pid()
+        self._args.pids = browser.get_pids()
+        return browser
+
+    def _get_url(self, page):
+        """
+        Returns the URL the browser opens for page, its local URL when the
+        pages are recorded or replayed.
+        """
+        if getattr(self._args, "replay", "off") == "off":
+            return page
+
+        return self._get_replay().url(page)
+
+    def _get_replay(self):
+        if getattr(self, "_replay", None) is None:
+            self._replay = ReplayServer(self._args.replay_dir, self._args.replay, self._args.replay_port).start()
+
+        return self._replay
+
+    def _stop_replay(self):
+        if getattr(self, "_replay", None) is not None:
+            self._replay.stop()
+            self._replay = None
+
+    def _get_cache(self):
+        if getattr(self, "_cache", None) is None:
+            self._cache = ArtifactCache(os.path.expanduser(self._args.cache_dir), self._args.cache_size * 2**20)
+
+        return self._cache
+
+    def _release_browser(self, browser, config):
+        if config.get("reuse", False):
+            self._sessions[config["name"]] = browser
+        else:
+            browser.finalize()
 
-        for benchmark in self._get_benchmarks():
-            try:
-                benchmark = Benchmark._create_benchmark(benchmark, self._args, browser.get_name(), page)
-                partial = self._run_benchmark(benchmark, browser, partial)
-            except:
-                print("Warning: benchmark {} not supported".format(benchmark))
+    def _close_sessions(self):
+        for browser in self._sessions.values():
+            browser.finalize()
 
-        browser.finalize()
-        return partial if df is None else concat([df, partial])
+        self._sessions = {}
 
-    def _run_benchmark(self, benchmark, browser, partial):
+    def _run_benchmark(self, benchmark, browser):
         df = benchmark.log()
+        df['Warm-up'] = self._warmup
+
+        for key, value in self._launch.items():
+            df[key] = value
+
         df['Browser'] = browser.get_name()
-        df['Page'] = browser.get_page()
+        df['Build'] = browser.get_build()
+        df['Page'] = self._args.page  # the page rather than its local URL when replayed
         df['OS'] = browser.get_os()
 
-        res = df if partial is None else partial.combine_first(df)
+        return df
+
+    def _iteration_rows(self, benchmark, summary):
+        """
+        Returns the rows of every iteration of a collector, the comparison of
+        runs tests them rather than the summaries.
+        """
+        if self._journal is None:
+            return None
+
+        rows = benchmark.iterations.copy()
+        rows['Iteration'] = range(len(rows))
+        rows['Collector'] = benchmark.get_name()
+
+        for key in ('Browser', 'Build', 'Page', 'OS'):
+            rows[key] = summary[key].iloc[0]
+
+        return rows
+
+    @staticmethod
+    def get_collector_versions(benchmarks):
+        """
+        Returns the version of every collector, a digest of the code of its
+        module and of its base classes' ones, which changes with any change
+        of the way its metrics are computed.
+        """
+        versions = {}
+
+        for benchmark in benchmarks:
+            if benchmark in Benchmark._collectors:
+                modules = [inspect.getmodule(cls) for cls in Benchmark._collectors[benchmark].__mro__[:-1]]
+                versions[benchmark] = Journal.digest([inspect.getsource(module) for module in modules])[:12]
 
-        return res
+        return versions
 
     @staticmethod
     def _create_benchmark(benchmark, args, browser, page):
@@ -83,6 +355,10 @@ class Benchmark:
             return BLA(args)
         elif benchmark == "IPPET":
             return IPPET(args, browser, page)  # IPPET uses browser process and page data
+        elif benchmark == "RAPL":
+            return RAPL(args)
+        elif benchmark == "ProcStat":
+            return ProcStat(args)
         else:
             raise Exception("Benchmark not found")
 
@@ -96,27 +372,142 @@ class Benchmark:
     def _get_benchmarks(self):
         return self._config["Benchmarks"]
 
+class SessionBenchmark(Benchmark):
+    """
+    One of the parallel sessions of a concurrent run: takes cells from a
+    shared queue and runs them with the browser in its cgroup slice and with
+    a home directory of its own, so that the browser profiles of the sessions
+    don't collide. The configuration, journal, artifact cache and replay
+    server are shared with the parent benchmark.
+    """
+
+    def __init__(self, parent, slice, benchmarks):
+        self._args = copy.copy(parent._args)
+        self._args.cgroup = slice
+        self._sessions = {}
+        self._journal = parent._journal
+        self._done = parent._done
+        self._config = parent._config
+        self._benchmarks = benchmarks
+        self._cgroup = slice
+        self._home = tempfile.mkdtemp(prefix="energia-session-")
+        self._env = dict(os.environ, HOME=self._home, MOZ_NO_REMOTE="1")
+        self._replay = parent._get_replay() if getattr(self._args, "replay", "off") != "off" else None
+        self._cache = parent._get_cache()
+        self.iterations = None
+
+    def run(self, cells):
+        while True:
+            try:
+                page, browser = cells.popleft()
+            except IndexError:
+                break
+
+            try:
+                self._run_iteration(None, page, browser)
+            except Exception:
+                print("Warning: session {} failed on {}: {}".format(os.path.basename(self._cgroup.path), page, sys.exc_info()[1]))
+
+        self._close_sessions()
+
+    def close(self):
+        self._cgroup.remove()
+        shutil.rmtree(self._home, ignore_errors=True)
+
+    def _get_benchmarks(self):
+        return self._benchmarks
+
+    def _release_browser(self, browser, config):
+        # a reused instance can't be reached with MOZ_NO_REMOTE and would be navigated from outside the slice
+        browser.finalize()
+
+
 class ClientBenchmark(Benchmark):
     def __init__(self, args):
+        self._args = args
+        self._sessions = {}
+        self._journal = None  # the dispatcher journals the results
+        self._done = set()
+        self._cgroup = None
+        self._env = None
+        self._config = None
+        self._config_id = None
+        self._heartbeat = None
+        self._worker_id = "{}-{}-{}".format(platform.node(), os.getpid(), uuid.uuid4().hex[:8])
         self._context = zmq.Context()
-        self._scatter_socket = self._context.socket(zmq.PULL)
-        self._gather_socket = self._context.socket(zmq.PUSH)
-
-        ports = {"Windows": 9000, "Darwin": 9001, "Linux": 9002}
-        self._scatter_socket.connect("tcp://{}:{}".format(args.address, ports[platform.system()]))
-        self._gather_socket.connect("tcp://{}:9003".format(args.address))
+        self._client = protocol.Client(self._context, args.address)
 
     def log(self):
+        self._handshake()
+
         while True:
-            msg = pickle.loads(self._scatter_socket.recv())
-            self._args = msg["args"]
-            self._config = msg["config"]
+            msg = self._client.request(protocol.ready(self._worker_id, platform.system()), "job", "wait", "ack")
+
+            if msg["type"] == "ack":
+                self._handshake()  # the dispatcher doesn't know us, e.g. it was restarted
+                continue
+            elif msg["type"] == "wait":
+                sleep(msg["delay"])
+                continue
+
+            if msg["config"] != self._config_id:
+                self._handshake()
+
             page = msg["page"]
-            browser = msg["browser"]
+            browser = dict(self._get_browsers()[msg["browser"]])
+            self._config["Benchmarks"] = msg["collectors"]
 
             print("Processing request for {} on {}".format(page, browser["name"]))
-            df = self._run_iteration(None, page, browser)
-            self._gather_socket.send(pickle.dumps(df))
+            stop = threading.Event()
+            heartbeat = threading.Thread(target=self._send_heartbeats, args=(msg["id"], stop))
+            heartbeat.start()
+
+            try:
+                if msg["iterations"]:
+                    start, end = msg["iterations"]
+                    partial = self._run_shard(page, browser, msg["collectors"][0], start, end)
+                    reply = protocol.partial(self._worker_id, msg["id"], partial)
+                else:
+                    try:
+                        df = self._run_iteration(None, page, browser)
+                    except Exception:
+                        print("Warning: {} on {} failed: {}".format(page, browser["name"], sys.exc_info()[1]))
+                        df = None
+
+                    reply = protocol.result(self._worker_id, msg["id"], df)
+            finally:
+                stop.set()
+                heartbeat.join()
+
+            self._client.request(reply, "ack")
+
+    def _handshake(self):
+        msg = self._client.request(protocol.hello(self._worker_id, platform.system(), platform.node()), "config")
+
+        for key, value in msg["args"].items():
+            setattr(self._args, key, value)
+
+        self._config = msg["config"]
+        self._config_id = msg["id"]
+        self._heartbeat = msg["heartbeat"]
+
+    def _send_heartbeats(self, job_id, stop):
+        # zmq sockets can't be shared among threads, heartbeats get their own channel
+        client = protocol.Client(self._context, self._args.address)
+
+        while not stop.wait(self._heartbeat):
+            if not client.request(protocol.heartbeat(self._worker_id, job_id), "ack")["valid"]:
+                print("Warning: lease of {} lost, the job has been requeued".format(job_id))
+
+        client.close()
+
+def _parse_target(value):
+    """
+    Parses a --target_ci entry, either a bare relative half-width applied to
+    every collector's default metrics or a "metric=half-width" pair.
+    """
+    key, _, target = value.rpartition("=")
+    return (key.strip() or "*", float(target))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Desktop Browser Power benchmarking Utility",
@@ -126,29 +517,72 @@ if __name__ == "__main__":
     parser.add_argument("-d", "--duration", help="Collection duration in s", default=30, type=int)
     parser.add_argument("-i", "--iterations", help="Number of iterations", default=10, type=int)
     parser.add_argument("-o", "--output", help="Path of the final csv output", default="report.csv")
+    parser.add_argument("--store", help="Directory of the results store every run is appended to, empty to disable", default="results")
     parser.add_argument("-p", "--path", help="Tool path", default="")
+    parser.add_argument("--grace", help="Seconds a tool may run past the collection duration before it is killed", default=30, type=int)
     parser.add_argument("-b", "--benchmark", help="Benchmark to run", default="idle")
     parser.add_argument("-c", "--config", help="Configuration file", default="config.json")
-    parser.add_argument("-s", "--sleep", help="Seconds to sleep before the benchmarks start recording", default=120, type=int)
+    parser.add_argument("-s", "--sleep", help="Seconds to sleep before the benchmarks start recording, "
+                        "the upper bound of the warm-up in steady mode", default=120, type=int)
     parser.add_argument("-r", "--is_dispatcher", help="Set if this instance is a dispatcher", dest="is_dispatcher", action="store_true")
     parser.add_argument("-w", "--is_worker", help="Set if this instance is a worker", dest="is_worker", action="store_true")
     parser.add_argument("-a", "--address", help="Dispatcher address", default=None)
-    parser.add_argument("-t", "--collect_interval", help="Set if it is desired to store the entire interval data to desktop", action="store_true")
+    parser.add_argument("-t", "--collect_interval", help="Set to archive the per-sample series of all collectors", action="store_true")
+    parser.add_argument("--archive", help="Directory of the archive of per-sample series", dest="archive_dir", default="interval_data")
+    parser.add_argument("-g", "--group_collectors", help="Set to run all compatible collectors in the same measurement window",
+                        action="store_true")
+    parser.add_argument("--warmup", help="Warm-up mode, either a fixed sleep or until CPU and power are steady",
+                        choices=["fixed", "steady"], default="fixed")
+    parser.add_argument("--warmup_window", help="Seconds of stable samples required to end a steady warm-up", default=15, type=float)
+    parser.add_argument("--warmup_interval", help="Seconds between warm-up samples", default=1, type=float)
+    parser.add_argument("--warmup_threshold", help="Maximum relative standard deviation of a stable warm-up window", default=0.1, type=float)
+    parser.add_argument("--concurrency", help="Number of browser sessions run in parallel on Linux, each in its own cgroup "
+                        "with its own CPUs; package-level collectors still run one session at a time", default=1, type=int)
+    parser.add_argument("--cgroup_root", help="Mount point of the cgroup v2 hierarchy, looked up if not set", default=None)
+    parser.add_argument("--replay", help="Record the pages into --replay_dir and serve them from a local server, "
+                        "or only replay the recorded ones", choices=["off", "record", "replay"], default="off")
+    parser.add_argument("--replay_dir", help="Directory of the recorded pages", default="replay")
+    parser.add_argument("--replay_port", help="Port of the local page server, 0 for any free port", default=0, type=int)
+    parser.add_argument("--cache_dir", help="Directory of the cache of downloaded browser builds", default="~/.energia/cache")
+    parser.add_argument("--cache_size", help="Size limit of the cache of downloaded browser builds in MB", default=2048, type=int)
+    parser.add_argument("--target_ci", help="Stop iterating once the relative CI half-width of the metrics is below this value, "
+                        "either for all of a collector's default metrics (e.g. 0.05) or per metric (e.g. \"Processor Watt=0.02\")",
+                        nargs="+", type=_parse_target, default=None)
+    parser.add_argument("--min_iterations", help="Minimum number of iterations when --target_ci is set", default=3, type=int)
+    parser.add_argument("--max_iterations", help="Maximum number of iterations when --target_ci is set, defaults to --iterations", default=None, type=int)
+    parser.add_argument("--journal", help="Path of the journal of completed results", default="journal.jsonl")
+    parser.add_argument("--resume", help="Set to resume an interrupted run from its journal", action="store_true")
+    parser.add_argument("--heartbeat", help="Seconds between worker heartbeats", default=10, type=int)
+    parser.add_argument("--lease", help="Seconds without heartbeat after which a job is requeued", default=60, type=int)
+    parser.add_argument("--shard_iterations", help="Split every cell into jobs of this many iterations of a single collector, "
+                        "0 to dispatch whole (page, browser) cells", default=0, type=int)
+    parser.add_argument("--job_timeout", help="Seconds after which a job is requeued even if its worker is alive, "
+                        "defaults to twice the expected duration of a job", default=None, type=int)
+    parser.add_argument("--report_interval", help="Seconds between dispatcher throughput reports", default=300, type=int)
 
     parser.set_defaults(is_dispatcher=False)
     parser.set_defaults(is_worker=False)
 
     args = parser.parse_args()
-    args.interval_directory = "interval_data\\"
+    args.target_ci = dict(args.target_ci) if args.target_ci else None
     args.image = None
+    args.run = ResultStore.run_id()
     df = None
+    store = None
+    benchmark = None
+
+    if args.store and not args.is_worker:
+        with open(args.config) as f:
+            config = json.load(f)
+
+        store = ResultStore(args.store)
+        store.begin_run(Journal.digest(config), Benchmark.get_collector_versions(config["Benchmarks"]),
+                        {key: value for key, value in vars(args).items() if isinstance(value, (int, float, str))}, args.run)
 
     if args.is_dispatcher:
-        dispatcher = Dispatcher(args)
-        df = dispatcher.run()
+        benchmark = Dispatcher(args)
+        df = benchmark.run()
     else:
-        benchmark = None
-
         if args.benchmark == "idle":
             if not args.is_worker:
                benchmark = Benchmark(args)
@@ -161,6 +595,10 @@ if __name__ == "__main__":
             benchmark = BLA(args)
         elif args.benchmark == "IPPET":
             benchmark = IPPET(args)
+        elif args.benchmark == "RAPL":
+            benchmark = RAPL(args)
+        elif args.benchmark == "ProcStat":
+            benchmark = ProcStat(args)
         else:
             raise Exception("Benchmark not found")
 
@@ -168,6 +606,19 @@ if __name__ == "__main__":
 
     if df is not None:
         df.to_csv(args.output, float_format="%.3f")
+
+        if store:
+            store.append(args.run, df)
+
+            if getattr(benchmark, "iterations", None) is not None:
+                store.append(args.run, benchmark.iterations, "iterations")
+
+            store.end_run(args.run)
+            print("Results stored as run {} in {}".format(args.run, args.store))
+
+        # only now that the results are written, until then a --resume can recover them
+        if hasattr(benchmark, "remove_journal"):
+            benchmark.remove_journal()
     else:
         print("Warning: no output produced")
 
@@ -1,16 +1,23 @@
 import platform
 import os
-import tempfile
-import urllib
 import sys
+import shlex
+import subprocess
+import procfs
 
 class Browser:
-    def __init__(self, name, path, page, installURL):
+    def __init__(self, name, path, page, installURL, cache=None):
         self.page = page
         self.browser = path
         self.description = name
         self.path = path
         self.installURL = installURL
+        self.cache = cache
+        self.process = None
+        self.pids = []
+        self.build = None
+        self.cgroup = None  # the cgroup slice of a concurrent session
+        self.env = None
 
     def get_name(self):
         return self.description
@@ -24,35 +31,71 @@ class Browser:
     def get_os(self):
         return platform.system()
 
+    def get_build(self):
+        return self.build or ""
+
+    def get_pid(self):
+        return self.process.pid if self.process else None
+
+    def get_pids(self):
+        """
+        Records and returns the process tree of the browser, if known.
+        """
+        if self.process:
+            self.pids = procfs.process_tree(self.process.pid)
+
+        return self.pids
+
+    def is_running(self):
+        return self.process is None or self.process.poll() is None
+
+    def navigate(self, page):
+        """
+        Opens page in the running instance of the browser. Browsers forward a
+        URL passed on the command line to their running instance.
+        """
+        self.page = page
+        self.initialize()
+
     @staticmethod
-    def create_browser(name, path, page, installURL):
+    def create_browser(name, path, page, installURL, cache=None):
         os = platform.system()
 
         if os == "Linux":
-            return UbuntuBrowser(name, path, page, installURL)
+            return UbuntuBrowser(name, path, page, installURL, cache)
         elif os == "Darwin":
-            return OSXBrowser(name, path, page, installURL)
+            return OSXBrowser(name, path, page, installURL, cache)
         elif os == "Windows":
-            return WinBrowser(name, path, page, installURL)
+            return WinBrowser(name, path, page, installURL, cache)
         else:
             assert(0)
 
 class WinBrowser(Browser):
-    def __init__(self, name, path, page, installURL):
-        super().__init__(name, path, page, installURL)
+    def __init__(self, name, path, page, installURL, cache=None):
+        super().__init__(name, path, page, installURL, cache)
 
     def initialize(self):
-        path = ""
-        file = self.browser
-        tmpdir = tempfile.mkdtemp()
-        if self.installURL:
-            installer_file = os.path.join(tmpdir, self.installURL.split('/')[-1])
+        self._install()
+        self._launch()
 
+    def navigate(self, page):
+        self.page = page
+        self._launch()
+
+    def _install(self):
+        if self.installURL:
             try:
-                # NOTE: .request is needed for python3
-                urllib.request.urlretrieve(self.installURL, installer_file)
+                installer_file, digest = self.cache.fetch(self.installURL)
             except Exception:
                 print("Exception while getting url: {}, {}".format(self.installURL, sys.exc_info()[1]))
+                return
+
+            if self.build is None:
+                self.build = digest[:12]
+
+            if digest == self.cache.get_tag(self.installURL, "installed"):
+                print("Browser already installed from {}".format(installer_file))
+                return
 
             if os.path.isabs(self.browser):
                 #uninstall
@@ -64,10 +107,15 @@ class WinBrowser(Browser):
 
             os.system(installer_file + ' -ms')
             print("Installing new browser {}".format(installer_file))
+            self.cache.set_tag(self.installURL, "installed", digest)
 
-            if os.path.isabs(self.browser):
-                drive, path_and_file = os.path.splitdrive(self.browser)
-                path, file = os.path.split(path_and_file)
+    def _launch(self):
+        path = ""
+        file = self.browser
+
+        if os.path.isabs(self.browser):
+            drive, path_and_file = os.path.splitdrive(self.browser)
+            path, file = os.path.split(path_and_file)
 
 # adding -setDefaultBrowswer might be needed for firefox, but fails for IE
 #        cmd = "start /D \"" + path + "\" " + file + " -setDefaultBrowser " + self.page
@@ -81,8 +129,8 @@ class WinBrowser(Browser):
         os.system("taskkill /im " + self.browser + ".exe > NUL 2>&1")
 
 class OSXBrowser(Browser):
-    def __init__(self, name, path, page, installURL):
-        super().__init__(name, path, page, installURL)
+    def __init__(self, name, path, page, installURL, cache=None):
+        super().__init__(name, path, page, installURL, cache)
 
     def initialize(self):
         if self.description == "Safari":
@@ -94,16 +142,73 @@ class OSXBrowser(Browser):
         os.system('osascript -e \"tell application \\\"' + self.browser + '\\\" to quit\"')
 
 class UbuntuBrowser(Browser):
-    def __init__(self, name, path, page, installURL):
-        super().__init__(name, path, page, installURL)
+    _close_timeout = 10
+
+    def __init__(self, name, path, page, installURL, cache=None):
+        super().__init__(name, path, page, installURL, cache)
 
     def initialize(self):
-        os.system(self.browser + " " + self.page + "&")
+        cmd = shlex.split(self.browser) + [self.page]
+
+        if self.cgroup is None:
+            self.process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True,
+                                            env=self.env)
+            return
+
+        # preexec_fn isn't safe in the sessions' threads, the browser is held by a shell until its pid is moved
+        # into the slice, so that none of its children starts outside of it
+        self.process = subprocess.Popen(["sh", "-c", 'read line; exec "$@"', "sh"] + cmd, stdin=subprocess.PIPE,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True,
+                                        env=self.env)
+
+        try:
+            self.cgroup.attach(self.process.pid)
+        except:
+            self.process.kill()
+            self.process.wait()
+            raise
+        finally:
+            self.process.stdin.close()
+
+    def navigate(self, page):
+        self.page = page
+        cmd = shlex.split(self.browser) + [self.page]
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True, env=self.env)
+
+        try:
+            process.wait(self._close_timeout)
+        except subprocess.TimeoutExpired:
+            # a new instance rather than a hand-off of the URL to the running one
+            print("Warning: {} didn't forward {} to its running instance, relaunching it".format(self.description, page))
+            procfs.terminate([pid for pid in procfs.process_tree(process.pid) if pid != process.pid] + [process.pid])
+            process.poll()
+            self.finalize()
+            self.initialize()
 
     def finalize(self):
+        pids = self.get_pids()
+
+        if self.cgroup is not None:
+            # the windows of the other sessions have the same title, only terminate this session's processes
+            procfs.terminate(self.cgroup.pids())
+            self.process.poll()
+            return
+
+        # close the window first, terminate() doesn't shutdown FF properly
         if self.browser == "chromium-browser":
-            os.system("wmctrl -c Chromium")
+            os.system("wmctrl -c Chromium > /dev/null 2>&1")
         elif self.browser == "firefox-trunk":
-            os.system("wmctrl -c Nightly")
+            os.system("wmctrl -c Nightly > /dev/null 2>&1")
         else:
-            os.system("wmctrl -c " + self.browser)
+            os.system("wmctrl -c " + os.path.basename(shlex.split(self.browser)[0]) + " > /dev/null 2>&1")
+
+        if self.process is None:
+            return
+
+        try:
+            self.process.wait(self._close_timeout)
+        except subprocess.TimeoutExpired:
+            pass
+
+        procfs.terminate([pid for pid in pids if pid != self.process.pid] + [self.process.pid])
+        self.process.poll()
@@ -0,0 +1,164 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+class ArtifactCache:
+    """
+    Local cache of downloaded artifacts, e.g. browser installers. Entries are
+    keyed by URL and stored under the SHA-256 of their content. Cached entries
+    are revalidated with conditional requests, concurrent fetches of the same
+    URL are deduplicated, and the least recently used entries are evicted once
+    the cache outgrows its size limit.
+    """
+
+    def __init__(self, directory, max_size):
+        self._directory = directory
+        self._max_size = max_size
+        self._timeout = 60
+        self._index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+        self._url_locks = {}
+
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+
+    def fetch(self, url, max_age=0):
+        """
+        Returns the local path and the digest of the artifact at url. The
+        cached copy is used without revalidation if it was checked less than
+        max_age seconds ago, or if the server can't be reached.
+        """
+        started = time.time()
+
+        with self._lock:
+            lock = self._url_locks.setdefault(url, threading.Lock())
+
+        with lock:
+            entry = self._load().get(url)
+
+            if entry and not os.path.exists(self._path(entry)):
+                entry = None
+
+            # a concurrent fetch of the same URL completed while we were waiting
+            if entry and (entry["checked"] >= started or time.time() - entry["checked"] < max_age):
+                return self._use(url, entry)
+
+            request = urllib.request.Request(url)
+            if entry and entry.get("etag"):
+                request.add_header("If-None-Match", entry["etag"])
+            if entry and entry.get("modified"):
+                request.add_header("If-Modified-Since", entry["modified"])
+
+            try:
+                with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                    entry = self._store(url, response, entry)
+            except urllib.error.HTTPError as e:
+                if e.code != 304 or entry is None:
+                    raise
+            except urllib.error.URLError:
+                if entry is None:
+                    raise
+
+                print("Warning: {} not reachable, using cached copy: {}".format(url, sys.exc_info()[1]))
+                return self._use(url, entry)
+
+            entry["checked"] = time.time()
+            return self._use(url, entry)
+
+    def get_tag(self, url, key):
+        return self._load().get(url, {}).get("tags", {}).get(key)
+
+    def set_tag(self, url, key, value):
+        """
+        Attaches a value to the cached entry of url, e.g. the digest of the
+        build which was last installed from it.
+        """
+        with self._lock:
+            index = self._load()
+            index[url].setdefault("tags", {})[key] = value
+            self._save(index)
+
+    def _store(self, url, response, entry):
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self._directory)
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in iter(lambda: response.read(1 << 20), b""):
+                    digest.update(chunk)
+                    f.write(chunk)
+        except:
+            # e.g. a connection reset or a full disk, no partial download is left behind
+            os.remove(tmp)
+            raise
+
+        extension = os.path.splitext(urllib.parse.urlparse(url).path)[1]
+        new = {"digest": digest.hexdigest(), "extension": extension, "size": os.path.getsize(tmp),
+               "etag": response.headers.get("ETag"), "modified": response.headers.get("Last-Modified"),
+               "tags": entry.get("tags", {}) if entry else {}}
+
+        if os.path.exists(self._path(new)):
+            os.remove(tmp)  # same content under a new URL or validator
+        else:
+            os.replace(tmp, self._path(new))
+
+        return new
+
+    def _use(self, url, entry):
+        entry["used"] = time.time()
+
+        with self._lock:
+            index = self._load()
+            old = index.get(url)
+            index[url] = entry
+
+            # drop the previous build of this URL unless another URL shares it
+            if old and self._path(old) != self._path(entry) and os.path.exists(self._path(old)):
+                if all(self._path(other) != self._path(old) for other in index.values()):
+                    os.remove(self._path(old))
+
+            self._evict(index, url)
+            self._save(index)
+
+        return self._path(entry), entry["digest"]
+
+    def _evict(self, index, keep):
+        blobs = {}
+        for url, entry in index.items():
+            blobs.setdefault(self._path(entry), []).append(url)
+
+        size = sum(index[urls[0]]["size"] for urls in blobs.values())
+        for path, urls in sorted(blobs.items(), key=lambda item: max(index[url]["used"] for url in item[1])):
+            if size <= self._max_size:
+                break
+            if keep in urls:
+                continue
+
+            size -= index[urls[0]]["size"]
+            for url in urls:
+                del index[url]
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _path(self, entry):
+        return os.path.join(self._directory, "blobs", entry["digest"] + entry["extension"])
+
+    def _load(self):
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+
+    def _save(self, index):
+        tmp = self._index_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(index, f, indent=4)
+        os.replace(tmp, self._index_path)
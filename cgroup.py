@@ -0,0 +1,159 @@
+"""
+Helpers to run processes in cgroup v2 slices on Linux. Every function takes
+the cgroup2 mount point as a parameter so it can run against synthetic
+fixtures, by default it is looked up in /proc/self/mounts.
+"""
+import os
+import time
+import procfs
+
+_parent = "energia"
+_controllers = ["cpuset", "cpu"]
+
+
+def mount_point(mounts="/proc/self/mounts"):
+    """
+    Returns where the cgroup2 hierarchy is mounted, e.g. /sys/fs/cgroup or
+    /sys/fs/cgroup/unified on hybrid setups, or None.
+    """
+    try:
+        with open(mounts) as f:
+            for line in f:
+                fields = line.split()
+
+                if len(fields) > 2 and fields[2] == "cgroup2":
+                    return fields[1]
+    except (IOError, OSError):
+        pass
+
+    return None
+
+
+def cpus():
+    """
+    Returns the CPUs this process may run on.
+    """
+    return sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count()))
+
+
+def partition(cpus, count):
+    """
+    Splits cpus in count disjoint sets of consecutive CPUs, as even as
+    possible.
+    """
+    if count > len(cpus):
+        raise Exception("{} sessions need as many CPUs, only {} available".format(count, len(cpus)))
+
+    return [cpus[len(cpus) * i // count:len(cpus) * (i + 1) // count] for i in range(count)]
+
+
+def read_flat(path):
+    """
+    Returns the counters of a flat keyed file such as cpu.stat.
+    """
+    with open(path) as f:
+        return {key: int(value) for key, value in (line.split() for line in f if line.strip())}
+
+
+def read_pressure(path):
+    """
+    Returns the PSI lines of a pressure file, e.g.
+    {"some": {"avg10": 0.0, "avg60": 0.0, "avg300": 0.0, "total": 1234}}
+    where total is the stall time in us.
+    """
+    res = {}
+
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+
+            if fields:
+                res[fields[0]] = {key: float(value) for key, value in (field.split("=") for field in fields[1:])}
+
+    return res
+
+
+class Slice:
+    """
+    A cgroup of its own for the processes of a session, <root>/energia/<name>,
+    pinned to a set of CPUs. The cpuset controller pins the whole cgroup when
+    it is available, otherwise the affinity of the processes entering the
+    slice is set, which their children inherit.
+    """
+
+    def __init__(self, name, cpus, root=None, parent=_parent):
+        root = root or mount_point()
+
+        if root is None or not os.path.exists(os.path.join(root, "cgroup.controllers")):
+            raise Exception("cgroup v2 hierarchy not found")
+
+        self.cpus = cpus
+        self.path = os.path.join(root, parent, name)
+        os.makedirs(self.path, exist_ok=True)
+
+        available = Slice._read(os.path.join(root, "cgroup.controllers")).split()
+        controllers = [controller for controller in _controllers if controller in available]
+
+        for path in (root, os.path.dirname(self.path)):
+            Slice._write(os.path.join(path, "cgroup.subtree_control"), " ".join("+" + controller for controller in controllers))
+
+        if "cpuset" in controllers:
+            Slice._write(os.path.join(self.path, "cpuset.cpus"), ",".join(str(cpu) for cpu in cpus))
+        else:
+            print("Warning: cpuset controller not available, {} is pinned through CPU affinity".format(name))
+
+    def attach(self, pid):
+        """
+        Moves the process pid into the slice, its children started afterwards
+        inherit it.
+        """
+        Slice._write(os.path.join(self.path, "cgroup.procs"), str(pid))
+
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(pid, self.cpus)
+
+    def pids(self):
+        return [int(pid) for pid in Slice._read(os.path.join(self.path, "cgroup.procs")).split()]
+
+    def cpu_stat(self):
+        return read_flat(os.path.join(self.path, "cpu.stat"))
+
+    def pressure(self, resource):
+        """
+        Returns the stall counters of resource (cpu, memory or io), or None
+        if the kernel doesn't track pressure.
+        """
+        path = os.path.join(self.path, resource + ".pressure")
+        return read_pressure(path) if os.path.exists(path) else None
+
+    def remove(self, timeout=10):
+        """
+        Terminates the processes left in the slice and removes it.
+        """
+        procfs.terminate(self.pids(), timeout)
+        deadline = time.time() + timeout
+
+        while True:
+            try:
+                os.rmdir(self.path)
+                return
+            except OSError:
+                # exited processes leave the cgroup shortly after
+                if time.time() > deadline:
+                    print("Warning: cgroup {} could not be removed".format(self.path))
+                    return
+
+                time.sleep(0.1)
+
+    @staticmethod
+    def _read(path):
+        with open(path) as f:
+            return f.read()
+
+    @staticmethod
+    def _write(path, value):
+        if not value:
+            return
+
+        with open(path, "w") as f:
+            f.write(value)
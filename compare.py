@@ -0,0 +1,258 @@
+import argparse
+import numpy
+import pandas
+
+from scipy import stats
+from pandas import DataFrame
+from overhead import Overhead
+from store import ResultStore
+
+cell_columns = ["OS", "Page", "Browser"]
+_ignored = ["Build", "Run", "Iteration", "Collector", "Iterations", "Duration", "Warm-up", "Timeouts", "X"]
+
+
+def metrics(df):
+    """
+    Returns the numeric metric columns of a result set.
+    """
+    return [column for column in df.columns if column not in cell_columns + _ignored and
+            not column.endswith(" CI") and not str(column).startswith(Overhead.prefix) and
+            df[column].dtype.kind in "biuf"]
+
+
+def filter_outliers(df, key):
+    """
+    Drops the iterations which the summaries leave out from the per-iteration
+    rows of all the cells at once. As in Wrapper._filter_outliers, the
+    columns are applied one after the other, each to the rows the previous
+    ones kept, and a column is skipped in the cells where it has missing
+    values.
+    """
+    df = df.dropna(subset=key).reset_index(drop=True)
+    keep = numpy.ones(len(df), dtype=bool)
+
+    for column in metrics(df):
+        rows = df[keep]
+        values = rows[column]
+        cells = [rows[name] for name in key]
+        groups = values.groupby(cells)
+
+        # Series.mad, the mean absolute deviation around the mean
+        median = groups.transform("median")
+        mad = (values - groups.transform("mean")).abs().groupby(cells).transform("mean")
+        skipped = (values.isnull().groupby(cells).transform("sum") > 0) | (groups.transform("size") <= 1)
+
+        inliers = skipped | ((values >= median - mad * 5) & (values <= median + mad * 5))
+        keep[rows.index[~inliers.values]] = False
+
+    return df[keep]
+
+
+def samples(df, columns, key=cell_columns):
+    """
+    Reshapes per-iteration rows into a (cells, iterations) array of samples
+    padded with NaNs, one cell per key and metric. Returns the cells as a
+    DataFrame and the array.
+    """
+    long = pandas.melt(df[key + columns], id_vars=key, var_name="Metric", value_name="Value")
+    long = long[long["Value"].notnull()]
+    keys = long[key + ["Metric"]]
+    codes, uniques = pandas.factorize(pandas.Series(list(map(tuple, keys.values)), index=keys.index))
+    positions = long.groupby(codes).cumcount().values
+
+    values = numpy.full((len(uniques), positions.max() + 1 if len(positions) else 0), numpy.nan)
+    values[codes, positions] = long["Value"].values.astype(float)
+    return DataFrame(list(uniques), columns=key + ["Metric"]), values
+
+
+def moments(df, columns, key=cell_columns):
+    """
+    Returns the cells and their means, variances and sizes, from either the
+    rows of every iteration, outliers excluded, or, when only summaries are
+    available, from the means, CIs and iteration counts of the summaries.
+    """
+    if "Iteration" in df:
+        cells, values = samples(filter_outliers(df, key), columns, key)
+        n = numpy.sum(~numpy.isnan(values), axis=1).astype(float)
+
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return cells, numpy.nanmean(values, axis=1), numpy.nanvar(values, axis=1, ddof=1), n, values
+
+    long = pandas.melt(df[key + ["Iterations"] + columns], id_vars=key + ["Iterations"],
+                       var_name="Metric", value_name="Mean")
+    ci = pandas.melt(df[key + [column + " CI" for column in columns]], id_vars=key,
+                     var_name="Metric", value_name="CI")
+    long["CI"] = ci["CI"].values
+    long = long[long["Mean"].notnull()]
+
+    n = long["Iterations"].values.astype(float)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        sd = long["CI"].values * numpy.sqrt(n) / stats.t.ppf(0.975, n - 1)
+
+    cells = long[key + ["Metric"]].reset_index(drop=True)
+    return cells, long["Mean"].values.astype(float), sd ** 2, n, None
+
+
+def welch(m1, v1, n1, m2, v2, n2):
+    """
+    Two-sided Welch's t-test of all the cells at once.
+    """
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        s1, s2 = v1 / n1, v2 / n2
+        t = (m2 - m1) / numpy.sqrt(s1 + s2)
+        df = (s1 + s2) ** 2 / (s1 ** 2 / (n1 - 1) + s2 ** 2 / (n2 - 1))
+        p = 2 * stats.t.sf(numpy.abs(t), df)
+
+    # identical constant samples
+    p[(s1 + s2 == 0) & (m1 == m2)] = 1
+    return p
+
+
+def bootstrap(x1, x2, resamples=1000, block=256, seed=0):
+    """
+    Bootstrap test of the difference of the means of all the cells at once:
+    both samples of a cell are resampled and the observed delta is compared
+    to the bootstrap variance of the means. The variance rather than the
+    share of resampled deltas crossing zero gives p-values fine enough for
+    the correction of thousands of tests. x1 and x2 are (cells, iterations)
+    arrays padded with NaNs, cells are processed in blocks to bound the
+    memory of the resamples.
+    """
+    random = numpy.random.RandomState(seed)
+    n1 = numpy.sum(~numpy.isnan(x1), axis=1)
+    n2 = numpy.sum(~numpy.isnan(x2), axis=1)
+    p = numpy.empty(len(x1))
+
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        observed = numpy.abs(numpy.nanmean(x2, axis=1) - numpy.nanmean(x1, axis=1))
+
+    for start in range(0, len(x1), block):
+        cells = slice(start, start + block)
+        means1 = _resample_means(x1[cells], n1[cells], resamples, random)
+        means2 = _resample_means(x2[cells], n2[cells], resamples, random)
+
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            # bootstrap variances of the means, corrected for their small sample bias
+            v1 = numpy.var(means1, axis=1) * n1[cells] / (n1[cells] - 1.)
+            v2 = numpy.var(means2, axis=1) * n2[cells] / (n2[cells] - 1.)
+            df = (v1 + v2) ** 2 / (v1 ** 2 / (n1[cells] - 1) + v2 ** 2 / (n2[cells] - 1))
+            p[cells] = 2 * stats.t.sf(observed[cells] / numpy.sqrt(v1 + v2), df)
+
+        p[cells][(v1 + v2 == 0) & (observed[cells] == 0)] = 1
+
+    return p
+
+
+def _resample_means(x, n, resamples, random):
+    """
+    Returns the means of resamples drawn with replacement from every row of
+    x, whose n values come before its NaN padding.
+    """
+    width = x.shape[1]
+    indices = (random.random_sample((len(x), resamples, width)) * n[:, None, None]).astype(int)
+    drawn = numpy.take_along_axis(numpy.nan_to_num(x)[:, None, :], indices, axis=2)
+    mask = numpy.arange(width)[None, None, :] < n[:, None, None]
+
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        return (drawn * mask).sum(axis=2) / n[:, None]
+
+
+def fdr(p):
+    """
+    Benjamini-Hochberg adjusted p-values, NaNs are left out.
+    """
+    q = numpy.full(len(p), numpy.nan)
+    valid = numpy.flatnonzero(~numpy.isnan(p))
+    order = valid[numpy.argsort(p[valid])]
+    ranked = p[order] * len(order) / numpy.arange(1, len(order) + 1)
+    q[order] = numpy.minimum(1, numpy.minimum.accumulate(ranked[::-1])[::-1])
+    return q
+
+
+def compare(baseline, candidate, method="welch", alpha=0.05):
+    """
+    Tests every (OS, page, browser, metric) cell of candidate against
+    baseline and returns the cells ranked by relative change, regressions,
+    i.e. significant increases, first. The collector is part of the cells
+    when both result sets have it, i.e. per-iteration rows.
+    """
+    columns = [column for column in metrics(baseline) if column in metrics(candidate)]
+    key = cell_columns + (["Collector"] if "Collector" in baseline and "Collector" in candidate else [])
+
+    if method == "bootstrap" and not ("Iteration" in baseline and "Iteration" in candidate):
+        raise Exception("The bootstrap needs the rows of every iteration of both result sets")
+
+    for df in (baseline, candidate):
+        if "Iteration" not in df:
+            columns = [column for column in columns if column + " CI" in df]
+
+    cells1, m1, v1, n1, x1 = moments(baseline, columns, key)
+    cells2, m2, v2, n2, x2 = moments(candidate, columns, key)
+
+    cells1["i"] = numpy.arange(len(cells1))
+    cells2["j"] = numpy.arange(len(cells2))
+    cells = pandas.merge(cells1, cells2, on=key + ["Metric"])
+    i, j = cells.pop("i").values, cells.pop("j").values
+
+    if method == "bootstrap":
+        p = bootstrap(x1[i], x2[j])
+        p[(n1[i] < 2) | (n2[j] < 2)] = numpy.nan
+    else:
+        p = welch(m1[i], v1[i], n1[i], m2[j], v2[j], n2[j])
+
+    cells["Baseline"] = m1[i]
+    cells["Candidate"] = m2[j]
+
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        cells["Change %"] = (m2[j] - m1[i]) / numpy.abs(m1[i]) * 100
+
+    cells["p"] = p
+    cells["q"] = fdr(p)
+    cells["Regression"] = (cells["q"] < alpha) & (cells["Candidate"] > cells["Baseline"])
+    cells["Improvement"] = (cells["q"] < alpha) & (cells["Candidate"] < cells["Baseline"])
+
+    rank = numpy.lexsort((-numpy.nan_to_num(cells["Change %"].values), ~cells["Regression"].values))
+    return cells.iloc[rank].reset_index(drop=True)
+
+
+def load(source, store, table):
+    """
+    Returns a result set, either a csv file or a run of the store, with the
+    rows of every iteration when the run has them.
+    """
+    if source.endswith(".csv"):
+        return pandas.read_csv(source, index_col=0)
+
+    df = store.read(runs=[source], table=table)
+
+    if not len(df) and table:
+        df = store.read(runs=[source])
+
+    if not len(df):
+        raise Exception("No results for {}".format(source))
+
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two runs cell by cell",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("baseline", help="Baseline, a run of the store or a csv report")
+    parser.add_argument("candidate", help="Candidate, a run of the store or a csv report")
+    parser.add_argument("-s", "--store", help="Directory of the results store", default="results")
+    parser.add_argument("-m", "--method", help="Test of the cells", choices=["welch", "bootstrap"], default="welch")
+    parser.add_argument("--alpha", help="False discovery rate of the reported changes", default=0.05, type=float)
+    parser.add_argument("-o", "--output", help="Path of the csv of all the compared cells", default="comparison.csv")
+    parser.add_argument("-n", "--top", help="Number of regressions to print", default=20, type=int)
+
+    args = parser.parse_args()
+    store = ResultStore(args.store)
+    df = compare(load(args.baseline, store, "iterations"), load(args.candidate, store, "iterations"), args.method, args.alpha)
+    df.to_csv(args.output, float_format="%.4f")
+
+    regressions = df[df["Regression"]]
+    print("{} cell(s) compared, {} regression(s), {} improvement(s)".format(len(df), len(regressions), df["Improvement"].sum()))
+
+    if len(regressions):
+        print(regressions.head(args.top).to_string(index=False, float_format=lambda x: "{:.4f}".format(x)))
@@ -16,46 +16,113 @@ google.load("visualization", "1", {packages:["corechart"]});
 google.setOnLoadCallback(drawChart);
 window.onresize = drawChart
 
+// data built by tools/build_dashboard.py, shards are fetched once when first rendered
+var manifest = null;
+var shards = {};
+
 function drawChart() {
-  var ds = new Miso.Dataset({
-    url : "/data/report.csv",
-    delimiter : ","
+  fetchJSON("/data/manifest.json", function(data) {
+    manifest = data;
+    loadToolbar();
+
+    var os = selectedOS();
+    var metrics = Object.keys(manifest.oses[os].metrics).sort();
+    var sortMetric = selectedText('sortPicker') || metrics[0];
+
+    fetchShard(os, sortMetric, function(sortShard) {
+      var pages = selectHottest(filter(sortShard.order, manifest.oses[os].pages));
+      var pending = metrics.length;
+      var loaded = {};
+
+      metrics.forEach(function(metric) {
+        fetchShard(os, metric, function(shard) {
+          loaded[metric] = shard;
+
+          if (--pending == 0) {
+            document.getElementById('body').innerHTML = "";
+            plotMetrics(manifest.oses[os], metrics, loaded, pages);
+          }
+        });
+      });
+    });
   });
+}
 
-  ds.fetch({
-    success: function(){
-      loadToolbar(ds);
-      ds = filter(ds);
-      sort(ds);
-      ds = selectHottest(ds);
-      plotMetrics(ds)
-    }
+function fetchJSON(url, callback) {
+  var request = new XMLHttpRequest();
+
+  request.onload = function() {
+    callback(JSON.parse(request.responseText));
+  }
+
+  request.open("GET", url, true);
+  request.send();
+}
+
+function fetchShard(os, metric, callback) {
+  var entry = manifest.oses[os].metrics[metric];
+  var key = entry.file + "#" + entry.hash;
+
+  if (key in shards) {
+    callback(shards[key]);
+    return;
+  }
+
+  fetchJSON("/data/" + entry.file, function(shard) {
+    shards[key] = shard;
+    callback(shard);
   });
 }
 
-function loadToolbar(ds) {
+function loadToolbar() {
   document.getElementById('limitPicker').onchange = function() {
-    document.getElementById('body').innerHTML = "";
     drawChart();
   }
 
+  var osPicker = setupOSPicker();
   var picker = setupScrollPicker();
   var sorter = setupSortPicker();
   var filter = setupFilter();
 
+  if (osPicker.childNodes.length == 0) {
+    Object.keys(manifest.oses).sort().forEach(function(os) {
+      addOptionToPicker(osPicker, os);
+    });
+  }
+
   if (picker.childNodes.length > 0 && sorter.childNodes.length > 0)
     return;
 
   addOptionToPicker(picker, "");
 
-  ds.eachColumn(function(columnName, column, index){
-    if (selectColumn(columnName)) {
-      addOptionToPicker(picker, columnName);
-      addOptionToPicker(sorter, columnName);
-    }
+  Object.keys(manifest.oses[selectedOS()].metrics).sort().forEach(function(metric) {
+    addOptionToPicker(picker, metric);
+    addOptionToPicker(sorter, metric);
   });
 }
 
+function selectedText(id) {
+  var picker = document.getElementById(id);
+  return picker.selectedIndex >= 0 ? picker.options[picker.selectedIndex].text : "";
+}
+
+function selectedOS() {
+  return selectedText('osPicker') || Object.keys(manifest.oses).sort()[0];
+}
+
+function setupOSPicker() {
+  var select = document.getElementById('osPicker');
+
+  select.onchange = function(e) {
+    // the metrics differ among OSes
+    document.getElementById('columnPicker').innerHTML = "";
+    document.getElementById('sortPicker').innerHTML = "";
+    drawChart();
+  }
+
+  return select;
+}
+
 function setupFilter() {
   var input = document.getElementById('filter');
 
@@ -65,7 +132,6 @@ function setupFilter() {
   input.onkeypress = function(e) {
     if (e.keyCode == 13) {
       window.location.hash = input.value;
-      document.getElementById('body').innerHTML = "";
       drawChart();
     }
   }
@@ -109,177 +175,35 @@ function addOptionToPicker(picker, columnName) {
   picker.appendChild(option);
 }
 
-function sort(ds) {
-  var enumeration = {};
-  var picker = document.getElementById("sortPicker");
-  var sortColumn = picker.options[picker.selectedIndex].text;
-  var pvalues = pvaluesForColumn(ds, sortColumn);
-
-  ds.each(function(row, index){
-    enumeration[row._id] = index;
-  });
-
-  ds.sort(function(rowA, rowB) {
-    var rowApvalue = pvalues[enumeration[rowA._id]];
-    var rowBpvalue = pvalues[enumeration[rowB._id]];
-
-    if (!isNaN(rowApvalue)) {
-      // sort by pvalue
-      if (rowApvalue * rowBpvalue < 0) {
-        return (rowApvalue > 0) ? -1 : 1
-      }
-
-      if (rowApvalue > rowBpvalue) {
-        return 1;
-      }
-
-      if (rowApvalue < rowBpvalue) {
-        return -1;
-      }
-    } else {
-      console.log("Warning: pvalue sorting not possbile due to missing data")
-    }
-
-    // sort by page
-    if (rowA.Page > rowB.Page) {
-      return 1;
-    }
-
-    if (rowA.Page < rowB.Page) {
-      return -1;
-    }
-
-    // sort by browser name
-    if (rowA.Browser > rowB.Browser) {
-      return 1;
-    }
-
-    if (rowA.Browser < rowB.Browser) {
-      return -1;
-    }
-
-    return 0;
-  });
-}
-
-function pvaluesForColumn(ds, column) {
-  var browsers = ds.countBy('Browser').toJSON();
-  var nBrowsers = browsers.length;
-  var ffIndex = -1;
-  var pvalues = [];
-
-  for (var i in browsers) {
-    if (browsers[i]['Browser'].startsWith("Firefox")) {
-      ffIndex = parseInt(i);
-      break;
-    }
-  }
-
-  ds.each(function(row, index) {
-    var zeroThreshold = 0.001;
-
-    if (index % nBrowsers == 0) {
-      var nSamples = row["Iterations"];
-      var i = index + ffIndex;
-      var ffRow = ds.rowByPosition(i);
-      var ffMean = ffRow[column];
-      var ffCI = ffRow[column + " CI"];
-      var ffSd = Math.max(stdFromMeanCI(ffMean, ffCI, nSamples), zeroThreshold);
-
-      var pvaluePos = Number.MAX_VALUE;
-      var pvalueNeg = Number.MAX_VALUE;
-
-      for (var browserIndex = 0; browserIndex < nBrowsers;  browserIndex++) {
-        if(browserIndex == ffIndex)
-          continue;
-
-        var j = index + browserIndex;
-        var browserRow = ds.rowByPosition(j);
-        var browserMean = browserRow[column];
-        var browserCI = browserRow[column + " CI"];
-        var browserSd = Math.max(stdFromMeanCI(browserMean, browserCI, nSamples), zeroThreshold);
-
-        var pv = Math.max(jStat.ttest(browserMean, ffMean, ffSd, nSamples, 2),
-                          jStat.ttest(ffMean, browserMean, browserSd, nSamples, 2));
-
-        if (ffMean < browserMean) {
-          pvalueNeg = Math.min(pv, pvalueNeg);
-        } else {
-          pvaluePos = Math.min(pv, pvaluePos);
-        }
-      }
-
-      if (pvaluePos != Number.MAX_VALUE)
-        pvalues.push(pvaluePos);
-      else
-        pvalues.push(-pvalueNeg);
-    } else {
-      pvalues.push(pvalues[pvalues.length - 1]);
-    }
-  });
-
-  return pvalues;
-}
-
-function stdFromMeanCI(mean, CI, n) {
-  //TODO: *assuming* 95% CI
-  var tvalue = jStat.studentt.inv(0.975, (n - 1));
-  var sem = CI/tvalue;
-  return Math.sqrt(n)*sem;
-}
-
-function filter(ds) {
+function filter(order, pages) {
   var value = document.getElementById('filter').value;
 
   if (value.length == 0)
-    return ds;
+    return order;
 
-  ds = ds.rows(function(row) {
-    return row['Page'].search(value) != -1;
+  return order.filter(function(index) {
+    return pages[index].search(value) != -1;
   });
-
-  return ds;
 }
 
-function selectHottest(ds) {
-  var browsers = ds.countBy('Browser').toJSON();
-  var nbrowsers = browsers.length;
+function selectHottest(order) {
   var picker = document.getElementById('limitPicker');
-  var max = parseInt(picker.options[picker.selectedIndex].text) * nbrowsers;
-  var index = 0;
+  var max = parseInt(picker.options[picker.selectedIndex].text);
 
   if (isNaN(max))
-    return ds;
-
-  ds = ds.rows(function(row) {
-    return index++ < max;
-  });
+    return order;
 
-  return ds;
+  return order.slice(0, max);
 }
 
-function plotMetrics(ds) {
-  var i = 0;
-  var nsamples = ds.rowByPosition(0)['Iterations'];
-
-  ds.eachColumn(function(columnName, column, index){
-    if (selectColumn(columnName)) {
-      var df = convertData(ds, columnName)
-      var div = createChartContainer(i);
-      plot(ds, df, div, columnName);
-      i++;
-    }
+function plotMetrics(data, metrics, shards, pages) {
+  metrics.forEach(function(metric, i) {
+    var df = convertData(data, shards[metric], pages);
+    var div = createChartContainer(i);
+    plot(data.browsers, df, div, metric);
   });
 }
 
-function selectColumn(columnName) {
-  return (columnName != "X" && !columnName.endsWith("CI") &&
-          columnName != "Page" && columnName != "Browser" &&
-          columnName != "OS" && !columnName.endsWith("Impact") &&
-          columnName != "Iterations" && columnName != "Duration" &&
-          !columnName.endsWith("Joules"));
-}
-
 function createChartContainer(index) {
   var div = document.createElement('div');
   div.className = 'chart'
@@ -288,39 +212,24 @@ function createChartContainer(index) {
   return div;
 }
 
-function convertData(ds, plot_column) {
-  var browsers = ds.countBy('Browser').toJSON();
-  var nbrowsers = browsers.length;
-  var plot_column_ci = plot_column + " CI"
+function convertData(data, shard, pages) {
+  return pages.map(function(index) {
+    var row = [data.pages[index]];
 
-  var res = []
-  var partial = []
+    for (var i = 0; i < data.browsers.length; i++) {
+      var base = shard.mean[index][i];
+      var ci = shard.ci[index][i] || 0;
 
-  ds.each(function(row, index){
-    if (index == 0) {
-      partial.push(row.Page)
-    }else if (index % nbrowsers == 0) {
-      partial = []
-      partial.push(row.Page)
+      row.push(base);
+      row.push(base == null ? null : base - ci);
+      row.push(base == null ? null : base + ci);
     }
 
-    var base = row[plot_column];
-    var ci = row[plot_column_ci];
-
-    partial.push(base);
-    partial.push(base - ci);
-    partial.push(base + ci);
-
-    if (index % nbrowsers == nbrowsers - 1) {
-      res.push(partial);
-    }
+    return row;
   });
-
-  return res;
 }
 
-function plot(ds, df, chart, title) {
-  var browsers = ds.countBy('Browser').toJSON();
+function plot(browsers, df, chart, title) {
   var nbrowsers = browsers.length;
   var size = nbrowsers * df.length * 50;
   var data = new google.visualization.DataTable();
@@ -329,7 +238,7 @@ function plot(ds, df, chart, title) {
 
   data.addColumn('string', 'Browser'); // Implicit domain column.
   for (var i in browsers) {
-    data.addColumn('number', browsers[i]["Browser"])
+    data.addColumn('number', browsers[i])
     data.addColumn({type:'number', role:'interval'});
     data.addColumn({type:'number', role:'interval'});
   }
@@ -1,44 +1,140 @@
 import zmq
+import sys
 import json
-import pickle
-import os
-import threading
-import functools
+import time
+import collections
+import protocol
+import pageset
 
 from pandas import DataFrame
+from journal import Journal
+from wrapper import Wrapper
     
 _context = zmq.Context()
 
 class Dispatcher:
+    """
+    Pull-based scheduler: workers ask for jobs, every job handed out is leased
+    to its worker until a deadline which the worker's heartbeats extend, and
+    jobs whose lease expires are requeued for the next worker that asks.
+
+    A job is either a whole (page, browser) cell or, with --shard_iterations,
+    a block of iterations of a single collector. The partial aggregates of the
+    shards are merged into the cell's summary once all of them are received.
+    """
+
     def __init__(self, args):
         self._args = args
-        self._tmp_file = "tmp.csv"
 
         with open(args.config) as f:
             self._config = json.load(f)
 
-        self._scatter_socket =  {}
-        for os in self._config["OS"]:
-            self._scatter_socket[os] = self._create_scatter_socket(os)
+        # workers receive the pages themselves, a change to a page set is a new configuration
+        self._config["Pages"] = pageset.resolve(self._config["Pages"], args.config)
 
-        self._gather_socket = _context.socket(zmq.PULL)
-        self._gather_socket.bind("tcp://*:9003")
+        self._config_id = Journal.digest(self._config)
+        self._journal = Journal(args.journal, {"config": self._config_id, "shard_iterations": args.shard_iterations})
+        self._rows = []
+        self._done = set()
+        self._received = set()
+        self._cells = {}
+        self._jobs = {}
+        self._queue = {}
+        self._leases = {}
+        self._workers = {}
+        self._socket = None
 
     def run(self):
-        scatter = threading.Thread(target=self._scatter)
-        scatter.start()
-        df = self._gather()
-        scatter.join()
-        if os.path.exists(self._tmp_file):
-            os.remove(self._tmp_file)
-        return df
-
-    def _create_scatter_socket(self, os):
-        ports = {"Windows": 9000, "Darwin": 9001, "Linux": 9002}
-        socket = _context.socket(zmq.PUSH)
-        socket.setsockopt(zmq.SNDTIMEO, 5000)
-        socket.bind("tcp://*:{}".format(ports[os]))
-        return socket
+        self._socket = _context.socket(zmq.ROUTER)
+        self._socket.bind("tcp://*:{}".format(protocol.port))
+        self._jobs = self._build_jobs()
+        self._restore(self._journal.open(self._args.resume))
+        self._queue = self._build_queue()
+        reported = time.time()
+
+        while any(self._queue.values()) or self._leases:
+            if self._socket.poll(1000):
+                identity, empty, data = self._socket.recv_multipart()
+
+                try:
+                    reply = self._handle(protocol.decode(data))
+                except Exception:
+                    # e.g. an outdated worker, it mustn't take the run down and its REQ socket still expects a reply
+                    print("Warning: invalid message dropped: {}".format(sys.exc_info()[1]))
+                    reply = protocol.ack(False)
+
+                self._socket.send_multipart([identity, empty, reply])
+
+            self._expire_leases()
+
+            if time.time() - reported > self._args.report_interval:
+                self._report()
+                reported = time.time()
+
+        self._report()
+        return DataFrame(self._rows)
+
+    def remove_journal(self):
+        """
+        Removes the journal, once its results are safely written elsewhere.
+        """
+        self._journal.remove()
+
+    def _restore(self, records):
+        for record in records:
+            self._add(record)
+
+        if records:
+            print("Resuming from {} journaled result(s)".format(len(records)))
+
+    def _add(self, record):
+        if isinstance(record, dict) and record.get("failed"):
+            job = self._jobs[record["job"]]
+            browser = self._get_browsers(job["os"])[job["browser"]]["name"]
+            print("Warning: no results for {} on {}".format(job["page"], browser))
+            self._done.add((job["os"], job["page"], browser))
+        elif isinstance(record, dict):
+            self._add_shard(record)
+        else:
+            self._rows.extend(record)
+            self._done.update((row["OS"], row["Page"], row["Browser"]) for row in record)
+
+    def _add_shard(self, record):
+        job = self._jobs[record["job"]]
+        self._received.add(job["id"])
+
+        cell = self._cells.setdefault(job["cell"], {"received": 0, "parts": {}, "launch": []})
+        parts = cell["parts"]
+        partial = record["partial"]
+
+        if partial.get("launch"):
+            cell["launch"].append(partial["launch"])
+
+        parts[job["collector"]] = partial if job["collector"] not in parts else Wrapper.merge(parts[job["collector"]], partial)
+        cell["received"] += 1
+
+        if cell["received"] < job["shards"]:
+            return
+
+        os, page, index = job["cell"]
+        row = {}
+
+        # same precedence as Benchmark's combine_first, the first collector wins
+        for collector in self._config["Benchmarks"]:
+            if parts.get(collector, {}).get("rows"):
+                for key, value in Wrapper.summarize(parts[collector], self._args.duration, "sharded").items():
+                    row.setdefault(key, value)
+
+        # every shard launched its own browser, as for the iterations their mean is reported
+        for launch in cell["launch"]:
+            for key in launch:
+                values = [other[key] for other in cell["launch"] if key in other]
+                row.setdefault(key, sum(values) / len(values))
+
+        browser = self._get_browsers(os)[index]
+        row.update({"Browser": browser["name"], "Build": browser.get("build", ""), "Page": page, "OS": os})
+        self._add([row])
+        del self._cells[job["cell"]]
 
     def _get_pages(self):
         return self._config["Pages"]
@@ -46,41 +142,167 @@ class Dispatcher:
     def _get_browsers(self, os):
         return self._config["OS"][os]
 
-    def _scatter(self):
+    def _build_jobs(self):
+        jobs = {}
+        block = self._args.shard_iterations
+        iterations = max(self._args.iterations, self._args.max_iterations or 0) if self._args.target_ci else self._args.iterations
+
         for os in self._config["OS"]:
             for page in self._get_pages():
-                for browser in self._get_browsers(os):
-                    socket = self._scatter_socket[os]
-                    print("sending {}".format(page))
-
-                    while True:
-                        try:
-                            self._send(socket, self._build_message(page, browser))
-                            break
-                        except zmq.error.Again:
-                            print("Warning: no {} workers reachable, retrying...".format(os))
-
-    def _gather(self):
-        df = DataFrame()
-        num_browsers = 0
-        for os in self._config["OS"]:
-            num_browsers = num_browsers + len(self._get_browsers(os))
-        nmsg = len(self._config["Pages"]) * num_browsers
-        nrcv = 0
-
-        #TODO: Handle missing data
-        while nrcv != nmsg:
-            msg = pickle.loads(self._gather_socket.recv())
-            df = df.append(msg)
-            df.to_csv(self._tmp_file, float_format="%.3f") # better safe than sorry
-            nrcv += 1
-
-        return df
-
-    def _build_message(self, page, browser):
-        #TODO: Don't send everything
-        return {"page": page, "browser": browser, "args": self._args, "config": self._config}
-
-    def _send(self, socket, msg):
-        msg = pickle.dumps(msg)
-        socket.send(msg)
+                for index, browser in enumerate(self._get_browsers(os)):
+                    if not block:
+                        job_id = "{}/{}/{}".format(os, page, index)
+                        jobs[job_id] = {"id": job_id, "os": os, "page": page, "browser": index}
+                        continue
+
+                    shards = len(self._config["Benchmarks"]) * len(range(0, iterations, block))
+                    for collector in self._config["Benchmarks"]:
+                        for start in range(0, iterations, block):
+                            job_id = "{}/{}/{}/{}/{}".format(os, page, index, collector, start)
+                            jobs[job_id] = {"id": job_id, "os": os, "page": page, "browser": index,
+                                            "cell": (os, page, index), "collector": collector, "shards": shards,
+                                            "iterations": [start, min(start + block, iterations)]}
+
+        return jobs
+
+    def _is_done(self, job):
+        if "iterations" in job:
+            return job["id"] in self._received
+
+        return (job["os"], job["page"], self._get_browsers(job["os"])[job["browser"]]["name"]) in self._done
+
+    def _build_queue(self):
+        queue = {os: collections.deque() for os in self._config["OS"]}
+
+        for job in self._jobs.values():
+            if not self._is_done(job):
+                queue[job["os"]].append(job)
+
+        return queue
+
+    def _handle(self, msg):
+        worker = self._workers.get(msg.get("worker"))
+
+        if worker is not None:
+            worker["seen"] = time.time()
+
+        if msg["type"] == "hello":
+            print("Worker {} ({}) connected".format(msg["host"], msg["os"]))
+            self._workers[msg["worker"]] = {"host": msg["host"], "os": msg["os"], "seen": time.time(),
+                                            "started": time.time(), "completed": 0, "busy": 0., "lost": 0}
+            return protocol.config(self._config_id, self._args, self._config, msg["os"])
+        elif msg["type"] in ("result", "partial"):
+            self._complete(msg)
+            return protocol.ack()
+        elif worker is None:
+            # unknown worker, e.g. after a dispatcher restart, it has to handshake again
+            return protocol.ack(False)
+        elif msg["type"] == "ready":
+            return self._lease(msg["worker"], msg["os"])
+        elif msg["type"] == "heartbeat":
+            lease = self._leases.get(msg["id"])
+            valid = lease is not None and lease["worker"] == msg["worker"]
+
+            if valid:
+                # heartbeats keep a lease alive, but a hung browser or tool doesn't get to hold a job forever
+                lease["deadline"] = min(time.time() + self._args.lease, lease["started"] + self._job_timeout())
+
+            return protocol.ack(valid)
+        else:
+            raise Exception("Unexpected {} message".format(msg["type"]))
+
+    def _lease(self, worker, os):
+        queue = self._queue.get(os)
+
+        if not queue:
+            return protocol.wait(self._args.heartbeat)
+
+        job = queue.popleft()
+        now = time.time()
+        self._leases[job["id"]] = {"job": job, "worker": worker, "started": now, "deadline": now + self._args.lease}
+        print("sending {} to {}".format(job["page"], self._workers[worker]["host"]))
+        collectors = [job["collector"]] if "collector" in job else self._config["Benchmarks"]
+        return protocol.job(self._config_id, job["id"], job["page"], job["browser"], collectors, job.get("iterations"))
+
+    def _job_timeout(self):
+        if self._args.job_timeout:
+            return self._args.job_timeout
+
+        if self._args.shard_iterations:
+            runs = self._args.shard_iterations  # a single collector
+        else:
+            runs = len(self._config["Benchmarks"]) * max(self._args.iterations, self._args.max_iterations or 0)
+
+        expected = self._args.sleep + runs * self._args.duration
+        return 2 * expected + self._args.lease
+
+    def _complete(self, msg):
+        if msg["id"] not in self._jobs or self._is_done(self._jobs[msg["id"]]):
+            # late duplicate of a requeued job, whose sender may still hold the lease of the requeued copy
+            self._release(msg["id"], msg["worker"], completed=False)
+            return
+
+        if msg["type"] == "partial":
+            record = {"job": msg["id"], "partial": msg["partial"]}
+        else:
+            record = protocol.rows(msg)
+
+            if not record:
+                # no collector could run, the cell is completed without results
+                record = {"job": msg["id"], "failed": True}
+
+        self._release(msg["id"], msg["worker"])
+        self._journal.append(record) # better safe than sorry
+        self._add(record)
+
+    def _release(self, job_id, worker_id, completed=True):
+        """
+        Releases the lease of job_id if worker_id holds it, and credits the
+        worker with the job if its result completed it.
+        """
+        lease = self._leases.get(job_id)
+
+        if lease is not None and lease["worker"] == worker_id:
+            del self._leases[job_id]
+        else:
+            # the worker's lease expired: the job was requeued, and its copy is dropped once completed, or it was
+            # leased to another worker, which keeps its lease until its own result arrives
+            lease = None
+
+            if completed:
+                for queue in self._queue.values():
+                    for job in list(queue):
+                        if job["id"] == job_id:
+                            queue.remove(job)
+
+        worker = self._workers.get(worker_id)
+
+        if worker is not None and completed:
+            worker["completed"] += 1
+
+            if lease is not None:
+                worker["busy"] += time.time() - lease["started"]
+
+    def _expire_leases(self):
+        now = time.time()
+
+        for job_id, lease in list(self._leases.items()):
+            if lease["deadline"] < now:
+                worker = self._workers[lease["worker"]]
+                worker["lost"] += 1
+                print("Warning: lease of {} on {} expired, requeuing".format(job_id, worker["host"]))
+                del self._leases[job_id]
+                self._queue[lease["job"]["os"]].appendleft(lease["job"])
+
+    def _report(self):
+        now = time.time()
+        pending = sum(len(queue) for queue in self._queue.values())
+        print("{} done, {} running, {} pending".format(len(self._done), len(self._leases), pending))
+
+        for worker_id, worker in sorted(self._workers.items()):
+            alive = now - worker["seen"] < self._args.lease
+            hours = (now - worker["started"]) / 3600.
+            print("  {} ({}): {} job(s), {:.1f} job(s)/h, {:.0f} s/job, {} lost{}".format(
+                  worker_id, worker["os"], worker["completed"], worker["completed"] / hours if hours else 0,
+                  worker["busy"] / worker["completed"] if worker["completed"] else 0, worker["lost"],
+                  "" if alive else ", not seen since {:.0f} s".format(now - worker["seen"])))
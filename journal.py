@@ -0,0 +1,86 @@
+import os
+import json
+import hashlib
+import threading
+
+
+class Journal:
+    """
+    Append-only log of results, one JSON record per line. Every record is
+    flushed and fsync'd as soon as it is written, so the cost per record is
+    constant and a crashed run can be rebuilt from what made it to disk.
+    """
+
+    def __init__(self, path, header):
+        self._path = path
+        self._header = header
+        self._file = None
+        self._lock = threading.Lock()  # concurrent sessions share the journal
+
+    def open(self, resume=False):
+        """
+        Opens the journal for appending and returns the records of a previous
+        run when resuming, otherwise any existing journal is discarded.
+        """
+        records = []
+
+        if resume and os.path.exists(self._path):
+            records = list(self.replay())
+        else:
+            with open(self._path, "w") as f:
+                f.write(Journal._dumps(self._header))
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._file = open(self._path, "a")
+        return records
+
+    def replay(self):
+        with open(self._path, "rb") as f:
+            try:
+                header = json.loads(f.readline().decode())
+            except ValueError:
+                raise Exception("Journal {} is not valid".format(self._path))
+
+            if header != self._header:
+                raise Exception("Journal {} was written by a different configuration".format(self._path))
+
+            for line in iter(f.readline, b""):
+                try:
+                    record = json.loads(line.decode())
+                except ValueError:
+                    record = None
+
+                if record is None or not line.endswith(b"\n"):
+                    # a torn record from a crash, drop it so new records can be appended
+                    print("Warning: ignoring truncated record in {}".format(self._path))
+                    f.seek(-len(line), os.SEEK_CUR)
+                    os.truncate(self._path, f.tell())
+                    break
+
+                yield record
+
+    def append(self, record):
+        with self._lock:
+            self._file.write(Journal._dumps(record))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        self.close()
+
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+    @staticmethod
+    def digest(config):
+        return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def _dumps(record):
+        return json.dumps(record, default=lambda x: x.item() if hasattr(x, "item") else str(x)) + "\n"
@@ -0,0 +1,73 @@
+import os
+import time
+import contextlib
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class Overhead:
+    """
+    Measures the harness' own footprint on the machine under test: CPU time,
+    context switches and wakeups of the Python process and of the collector
+    processes it spawned, and the wall-clock time spent in every phase of a
+    cell. Phases may nest, every span only counts its own time.
+    """
+
+    prefix = "Harness "
+
+    def __init__(self):
+        self.spans = {}
+        self._stack = []
+
+    @contextlib.contextmanager
+    def span(self, name):
+        started = time.time()
+        self._stack.append(0.)
+
+        try:
+            yield
+        finally:
+            nested = self._stack.pop()
+            elapsed = time.time() - started
+            self.spans[name] = self.spans.get(name, 0.) + elapsed - nested
+
+            if self._stack:
+                self._stack[-1] += elapsed
+
+    def pop_spans(self):
+        """
+        Returns the spans recorded so far as columns and resets them.
+        """
+        res = {"{}{} (s)".format(Overhead.prefix, name): value for name, value in self.spans.items()}
+        self.spans = {}
+        return res
+
+    @staticmethod
+    def usage():
+        """
+        Returns the CPU seconds of this process, of its terminated children,
+        and this process' voluntary and involuntary context switches.
+        """
+        if resource is None:
+            times = os.times()
+            return times[0] + times[1], times[2] + times[3], float("nan"), float("nan")
+
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return (own.ru_utime + own.ru_stime, children.ru_utime + children.ru_stime,
+                own.ru_nvcsw + children.ru_nvcsw, own.ru_nivcsw + children.ru_nivcsw)
+
+    @staticmethod
+    def delta(before, after=None):
+        """
+        Returns the usage between two calls of usage() as columns.
+        """
+        after = after or Overhead.usage()
+        own, children, voluntary, involuntary = [b - a for a, b in zip(before, after)]
+        return {Overhead.prefix + "CPU (s)": own,
+                Overhead.prefix + "Children CPU (s)": children,
+                Overhead.prefix + "Wakeups": voluntary,
+                Overhead.prefix + "CSwitches": voluntary + involuntary}
@@ -0,0 +1,228 @@
+"""
+Named page sets. A page set is built from a ranked list of sites, e.g. the
+Alexa or Tranco top 1M, read lazily from a local .zip, .gz or plain csv/list
+file: only the entries up to the requested population are decompressed.
+Hosts are normalised and deduplicated, then the pages are either the top
+entries or a random or rank-stratified sample of the population.
+
+Sets are saved as pagesets/<name>.json and a configuration references one
+by name instead of listing its pages, e.g. "Pages": "top500".
+"""
+
+import os
+import io
+import re
+import sys
+import gzip
+import json
+import random
+import zipfile
+import argparse
+
+from urllib.parse import urlsplit
+from cache import ArtifactCache
+
+_directory = "pagesets"
+_max_size = 2**30
+
+# second-level labels of country code domains, e.g. co.uk or com.cn
+_second_level = {"ac", "co", "com", "edu", "gob", "gov", "net", "ne", "or", "org"}
+
+
+def entries(path):
+    """
+    Yields the hosts of a ranked list, in rank order. Lines are either
+    "rank,host" as in the Alexa and Tranco lists or a bare host or URL.
+    """
+    with _open(path) as f:
+        for line in f:
+            fields = line.strip().split(",")
+            entry = fields[-1] if len(fields) < 3 else fields[1]
+
+            if entry and not entry.startswith("#"):
+                yield entry
+
+
+def _open(path):
+    if zipfile.is_zipfile(path):
+        archive = zipfile.ZipFile(path)
+        member = next(info for info in archive.infolist() if not info.filename.endswith("/"))
+        return io.TextIOWrapper(archive.open(member), encoding="utf-8", errors="replace")
+    elif path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    else:
+        return open(path, encoding="utf-8", errors="replace")
+
+
+def normalize(entry):
+    """
+    Returns the lowercase host of an entry, without scheme, credentials,
+    port, path or trailing dot, or None if it isn't a host name.
+    """
+    entry = entry.strip().lower()
+    host = urlsplit(entry if "://" in entry else "//" + entry).hostname or ""
+    host = host.rstrip(".")
+
+    return host if re.match(r"^[a-z0-9-]+(\.[a-z0-9-]+)+$", host) else None
+
+
+def site_key(host, dedupe):
+    """
+    Returns the key two hosts share when they are the same site:
+        host:   the host, ignoring a leading www.
+        domain: the registered domain, i.e. all subdomains are the same site
+        name:   the registered name regardless of its suffix, so that
+                wikipedia.com and wikipedia.org are the same site
+    Registered domains are approximated by the last two labels, or three for
+    the usual country code second levels such as co.uk.
+    """
+    labels = host.split(".")
+
+    if dedupe == "host":
+        return ".".join(labels[1:]) if labels[0] == "www" and len(labels) > 2 else host
+
+    suffix = 2 if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in _second_level else 1
+    name = labels[-suffix - 1] if len(labels) > suffix else labels[0]
+
+    if dedupe == "domain":
+        return ".".join(labels[-suffix - 1:])
+
+    return name
+
+
+def collect(path, population, dedupe="host", prefix=""):
+    """
+    Returns the first population distinct sites of a ranked list, reading
+    no further than needed.
+    """
+    seen = set()
+    pages = []
+
+    for entry in entries(path):
+        host = normalize(entry)
+
+        if host is None:
+            continue
+
+        key = site_key(host, dedupe)
+
+        if key in seen:
+            continue
+
+        seen.add(key)
+        pages.append(prefix + host if prefix and not host.startswith(prefix) else host)
+
+        if len(pages) == population:
+            break
+
+    return pages
+
+
+def sample(pages, count, method="top", strata=10, seed=0):
+    """
+    Picks count pages out of a ranked population: the top ones, a uniform
+    random sample, or a random sample of the same size from each of strata
+    rank bands. Samples keep the rank order.
+    """
+    if method == "top" or count >= len(pages):
+        return pages[:count]
+
+    generator = random.Random(seed)
+
+    if method == "random":
+        return [pages[i] for i in sorted(generator.sample(range(len(pages)), count))]
+
+    bands = [range(len(pages) * i // strata, len(pages) * (i + 1) // strata) for i in range(strata)]
+    picked = []
+
+    for i, band in enumerate(bands):
+        size = count * (i + 1) // strata - count * i // strata
+        picked.extend(generator.sample(band, min(size, len(band))))
+
+    return [pages[i] for i in sorted(picked)]
+
+
+def save(name, pages, source=None, options=None, directory=_directory):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name + ".json")
+
+    with open(path + ".tmp", "w") as f:
+        json.dump({"name": name, "source": source, "options": options or {}, "pages": pages}, f, indent=4)
+
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def load(name, directory=_directory):
+    path = os.path.join(directory, name + ".json")
+
+    if not os.path.exists(path):
+        raise Exception("Page set {} not found in {}".format(name, directory))
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def resolve(pages, config_path=None):
+    """
+    Returns the pages of a configuration, either listed or the name of a
+    page set stored next to the configuration file.
+    """
+    if not isinstance(pages, str):
+        return pages
+
+    directory = os.path.join(os.path.dirname(os.path.abspath(config_path)), _directory) if config_path else _directory
+    return load(pages, directory)["pages"]
+
+
+def _source(args):
+    if args.input:
+        return args.input, os.path.getsize(args.input), os.path.getmtime(args.input)
+
+    cache = ArtifactCache(os.path.expanduser(args.cache_dir), _max_size)
+    path, digest = cache.fetch(args.url, max_age=args.max_age)
+    return path, digest, None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a named page set from a ranked list of sites",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("name", help="Name of the page set")
+    parser.add_argument("-i", "--input", help="Local ranked list, a .zip, .gz or plain file", default=None)
+    parser.add_argument("-u", "--url", help="Ranked list to download when no input is given, cached in --cache_dir",
+                        default="http://s3.amazonaws.com/alexa-static/top-1m.csv.zip")
+    parser.add_argument("--cache_dir", help="Directory of the download cache", default="~/.energia/cache")
+    parser.add_argument("--max_age", help="Seconds during which a download is reused without revalidation", default=86400, type=int)
+    parser.add_argument("-n", "--count", help="Number of pages of the set", default=500, type=int)
+    parser.add_argument("-m", "--method", help="Selection of the pages", choices=["top", "random", "stratified"], default="top")
+    parser.add_argument("-p", "--population", help="Number of top sites sampled from, defaults to --count for top "
+                        "and ten times --count otherwise", default=None, type=int)
+    parser.add_argument("--strata", help="Number of rank bands of a stratified sample", default=10, type=int)
+    parser.add_argument("--seed", help="Seed of the random samples", default=0, type=int)
+    parser.add_argument("--dedupe", help="Sites considered the same: same host ignoring www., same registered domain, "
+                        "or same registered name regardless of its suffix", choices=["host", "domain", "name"], default="host")
+    parser.add_argument("--prefix", help="Prefix of the hosts, e.g. www.", default="")
+    parser.add_argument("--extra", help="Pages added in front of the set, e.g. about:blank", nargs="+", default=[])
+    parser.add_argument("-d", "--directory", help="Directory of the page sets", default=_directory)
+    parser.add_argument("-f", "--force", help="Rebuild the set even if its source and options didn't change", action="store_true")
+
+    args = parser.parse_args()
+    population = args.population or (args.count if args.method == "top" else args.count * 10)
+    path, version, modified = _source(args)
+    options = {"count": args.count, "method": args.method, "population": population, "strata": args.strata,
+               "seed": args.seed, "dedupe": args.dedupe, "prefix": args.prefix, "extra": args.extra}
+    source = {"path": args.input or args.url, "version": version, "modified": modified}
+
+    try:
+        previous = load(args.name, args.directory)
+    except Exception:
+        previous = None
+
+    if previous and not args.force and previous["source"] == source and previous["options"] == options:
+        print("Page set {} is up to date".format(args.name))
+        sys.exit(0)
+
+    pages = sample(collect(path, population, args.dedupe, args.prefix), args.count, args.method, args.strata, args.seed)
+    print("Page set {} saved to {} with {} page(s)".format(args.name, save(args.name, args.extra + pages, source, options,
+                                                                            args.directory), len(args.extra) + len(pages)))
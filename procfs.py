@@ -0,0 +1,165 @@
+"""
+Helpers to inspect processes through Linux's /proc. Every function takes the
+procfs root as a parameter so it can run against synthetic fixtures.
+"""
+import os
+import time
+import signal
+
+
+def read_stat(pid, root="/proc"):
+    """
+    Returns the fields of /proc/<pid>/stat, the command name excluded, as a
+    list indexed like proc(5) minus 3: fields[0] is the state, fields[1] the
+    parent pid, fields[11] and fields[12] utime and stime in clock ticks.
+    """
+    with open(os.path.join(root, str(pid), "stat")) as f:
+        data = f.read()
+
+    # the command name may contain spaces and parentheses
+    return data[data.rindex(")") + 2:].split()
+
+
+def pids(root="/proc"):
+    return [int(entry) for entry in os.listdir(root) if entry.isdigit()]
+
+
+def children(root="/proc"):
+    """
+    Returns a map from every pid to the list of its children.
+    """
+    res = {}
+
+    for pid in pids(root):
+        try:
+            res.setdefault(int(read_stat(pid, root)[1]), []).append(pid)
+        except (IOError, OSError, ValueError, IndexError):
+            pass  # the process exited meanwhile
+
+    return res
+
+
+def process_tree(pid, root="/proc"):
+    """
+    Returns pid and all its descendants which are still alive.
+    """
+    if not os.path.exists(os.path.join(root, str(pid))):
+        return []
+
+    tree = children(root)
+    res = [pid]
+
+    for parent in res:
+        res.extend(tree.get(parent, []))
+
+    return res
+
+
+def terminate(pids, timeout=10, root="/proc"):
+    """
+    Sends SIGTERM to the processes and SIGKILL to the ones that are still
+    alive after the timeout.
+    """
+    for sig in [signal.SIGTERM, signal.SIGKILL]:
+        for pid in pids:
+            try:
+                os.kill(pid, sig)
+            except OSError:
+                pass
+
+        deadline = time.time() + timeout
+        while pids and time.time() < deadline:
+            pids = [pid for pid in pids if _is_alive(pid, root)]
+            time.sleep(0.1)
+
+        if not pids:
+            return
+
+
+def _is_alive(pid, root="/proc"):
+    try:
+        os.waitpid(pid, os.WNOHANG)  # reap our own children
+    except OSError:
+        pass
+
+    try:
+        return read_stat(pid, root)[0] != "Z"
+    except (IOError, OSError, IndexError, ValueError):
+        return False
+
+
+def find(name, root="/proc"):
+    """
+    Returns the pids of the processes whose command name is name.
+    """
+    res = []
+
+    for pid in pids(root):
+        try:
+            with open(os.path.join(root, str(pid), "comm")) as f:
+                if f.read().strip() == name:
+                    res.append(pid)
+        except (IOError, OSError):
+            pass
+
+    return res
+
+
+def tasks(pid, root="/proc"):
+    try:
+        return [int(tid) for tid in os.listdir(os.path.join(root, str(pid), "task"))]
+    except (IOError, OSError):
+        return []
+
+
+def task_counters(pid, tid, root="/proc", ticks=100):
+    """
+    Returns the CPU seconds and the voluntary context switches, i.e. the
+    wakeups, of a thread. schedstat's nanosecond run time is preferred over
+    stat's clock ticks when the kernel provides it.
+    """
+    path = os.path.join(root, str(pid), "task", str(tid))
+
+    try:
+        with open(os.path.join(path, "schedstat")) as f:
+            cpu = int(f.read().split()[0]) / 1e9
+    except (IOError, OSError, ValueError, IndexError):
+        fields = read_stat(os.path.join(str(pid), "task", str(tid)), root)
+        cpu = (int(fields[11]) + int(fields[12])) / float(ticks)
+
+    wakeups = 0
+    with open(os.path.join(path, "status")) as f:
+        for line in f:
+            if line.startswith("voluntary_ctxt_switches:"):
+                wakeups = int(line.split()[1])
+
+    return cpu, wakeups
+
+
+def cpu_times(root="/proc"):
+    """
+    Returns the busy and total jiffies of the whole machine and the number
+    of logical CPUs, from /proc/stat.
+    """
+    ncpus = 0
+
+    with open(os.path.join(root, "stat")) as f:
+        for line in f:
+            if line.startswith("cpu "):
+                fields = [int(x) for x in line.split()[1:]]
+            elif line.startswith("cpu"):
+                ncpus += 1
+
+    return sum(fields) - fields[3] - fields[4], sum(fields), ncpus  # minus idle and iowait
+
+
+def idle_entries(root="/proc"):
+    """
+    Returns how many times the CPUs went idle, summed over all CPUs, from the
+    sched_goidle counters of /proc/schedstat, or None if unavailable.
+    """
+    try:
+        with open(os.path.join(root, "schedstat")) as f:
+            return sum(int(line.split()[4]) for line in f if line.startswith("cpu"))
+    except (IOError, OSError, ValueError, IndexError):
+        return None
@@ -0,0 +1,126 @@
+import json
+import zmq
+
+# Version of the dispatcher/worker wire protocol, bumped on incompatible changes
+VERSION = 2
+
+port = 9000
+
+# Experiment settings propagated to the workers, tool paths and addresses stay local
+_shared_args = ["resolution", "duration", "iterations", "sleep", "grace", "collect_interval", "run", "replay", "group_collectors",
+                "target_ci", "min_iterations", "max_iterations",
+                "warmup", "warmup_window", "warmup_interval", "warmup_threshold"]
+
+
+def encode(kind, **fields):
+    fields["v"] = VERSION
+    fields["type"] = kind
+    return json.dumps(fields, default=_to_builtin).encode()
+
+
+def decode(data, *kinds):
+    msg = json.loads(data.decode())
+
+    if msg.get("v") != VERSION:
+        raise Exception("Unsupported protocol version {}, expected {}".format(msg.get("v"), VERSION))
+    if kinds and msg.get("type") not in kinds:
+        raise Exception("Unexpected {} message, expected {}".format(msg.get("type"), " or ".join(kinds)))
+
+    return msg
+
+
+def hello(worker, os, host):
+    return encode("hello", worker=worker, os=os, host=host)
+
+
+def config(config_id, args, config, os):
+    """
+    Builds the configuration sent once to a worker when it connects, restricted
+    to the settings and browsers relevant for its OS.
+    """
+    shared = {key: getattr(args, key) for key in _shared_args if hasattr(args, key)}
+    config = {"Pages": config["Pages"], "Benchmarks": config["Benchmarks"], "OS": {os: config["OS"].get(os, [])}}
+    return encode("config", id=config_id, args=shared, config=config, heartbeat=args.heartbeat)
+
+
+def ready(worker, os):
+    return encode("ready", worker=worker, os=os)
+
+
+def job(config_id, job_id, page, browser, collectors, iterations=None):
+    return encode("job", config=config_id, id=job_id, page=page, browser=browser, collectors=collectors,
+                  iterations=iterations)
+
+
+def wait(delay):
+    return encode("wait", delay=delay)
+
+
+def heartbeat(worker, job_id):
+    return encode("heartbeat", worker=worker, id=job_id)
+
+
+def ack(valid=True):
+    return encode("ack", valid=valid)
+
+
+def result(worker, job_id, df):
+    """
+    Encodes a result DataFrame as a schema-tagged record: the column names
+    followed by the values of each row. A df of None, when no collector could
+    run, is sent without rows so that the cell is still completed.
+    """
+    if df is None:
+        return encode("result", worker=worker, id=job_id, schema=[], rows=[])
+
+    schema = [str(column) for column in df.columns]
+    return encode("result", worker=worker, id=job_id, schema=schema, rows=df.values.tolist())
+
+
+def partial(worker, job_id, partial):
+    """
+    Encodes the partial aggregate of a sharded job, see Wrapper.partial.
+    """
+    return encode("partial", worker=worker, id=job_id, partial=partial)
+
+
+def rows(msg):
+    return [dict(zip(msg["schema"], row)) for row in msg["rows"]]
+
+
+def _to_builtin(x):
+    return x.item() if hasattr(x, "item") else str(x)
+
+
+class Client:
+    """
+    Request/reply channel from a worker to the dispatcher. A request that gets
+    no reply within the timeout is sent again on a fresh socket, so workers
+    survive dispatcher restarts.
+    """
+
+    def __init__(self, context, address, timeout=10000):
+        self._context = context
+        self._address = "tcp://{}:{}".format(address, port)
+        self._timeout = timeout
+        self._socket = None
+
+    def request(self, msg, *kinds):
+        while True:
+            if self._socket is None:
+                self._socket = self._context.socket(zmq.REQ)
+                self._socket.setsockopt(zmq.LINGER, 0)
+                self._socket.connect(self._address)
+
+            self._socket.send(msg)
+
+            if self._socket.poll(self._timeout):
+                return decode(self._socket.recv(), *kinds)
+
+            print("Warning: dispatcher {} not reachable, retrying...".format(self._address))
+            self.close()
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
@@ -0,0 +1,239 @@
+import os
+import re
+import json
+import time
+import hashlib
+import argparse
+import threading
+import urllib.error
+import urllib.request
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+class ReplayArchive:
+    """
+    Recorded responses, keyed by method and URL. Bodies are stored under
+    their SHA-256 so that resources shared among pages are kept once:
+
+        <directory>/index.json
+        <directory>/blobs/<sha256>
+    """
+
+    def __init__(self, directory):
+        self._directory = directory
+        self._index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+        self._index = {}
+
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+
+        if os.path.exists(self._index_path):
+            with open(self._index_path) as f:
+                self._index = json.load(f)
+
+    def get(self, method, url):
+        entry = self._index.get(method + " " + url)
+
+        if entry is None:
+            return None
+
+        with open(os.path.join(self._directory, "blobs", entry["body"]), "rb") as f:
+            return entry["status"], entry["headers"], f.read()
+
+    def put(self, method, url, status, headers, body):
+        digest = hashlib.sha256(body).hexdigest()
+        path = os.path.join(self._directory, "blobs", digest)
+
+        with self._lock:
+            if not os.path.exists(path):
+                with open(path + ".tmp", "wb") as f:
+                    f.write(body)
+
+                os.replace(path + ".tmp", path)
+
+            self._index[method + " " + url] = {"status": status, "headers": headers, "body": digest, "recorded": time.time()}
+
+            with open(self._index_path + ".tmp", "w") as f:
+                json.dump(self._index, f)
+
+            os.replace(self._index_path + ".tmp", self._index_path)
+
+    def hosts(self):
+        return {url.split("/")[2] for url in (key.partition(" ")[2] for key in self._index)}
+
+    def __len__(self):
+        return len(self._index)
+
+
+class ReplayServer:
+    """
+    Local HTTP server the browsers load the pages from. Every site is served
+    under its host, e.g. http://127.0.0.1:<port>/www.google.com/, and the
+    absolute, protocol-relative and root-relative URLs of the text responses
+    are rewritten to point back at the server.
+
+    In record mode the responses missing from the archive are fetched from
+    the live site and recorded, in replay mode only recorded responses are
+    served and anything else is a 404, so that captures never depend on the
+    network.
+    """
+
+    _timeout = 30
+    # headers which don't apply to the rewritten, uncompressed responses served locally
+    _dropped_headers = {"connection", "content-encoding", "content-length", "content-security-policy",
+                        "content-security-policy-report-only", "keep-alive", "set-cookie",
+                        "strict-transport-security", "transfer-encoding", "alt-svc"}
+    _text_types = ("text/", "javascript", "json", "xml")
+    _absolute = re.compile(rb"(?:https?:)?//((?:[a-z0-9-]+\.)+[a-z]{2,})(?=[/\"'\s)?:#]|$)", re.I)
+    _root_relative = re.compile(rb"((?:src|href|action)\s*=\s*[\"']|url\(\s*[\"']?)/(?!/)", re.I)
+
+    def __init__(self, directory, mode="replay", port=0):
+        if mode not in ("record", "replay"):
+            raise Exception("Unknown replay mode {}".format(mode))
+
+        self.archive = ReplayArchive(directory)
+        self.mode = mode
+        # hosts served so far, to tell them apart from the first segment of root-relative paths
+        self._hosts = self.archive.hosts()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), ReplayServer._handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        print("Serving {} pages on port {} ({} responses recorded)".format(self.mode, self.port(), len(self.archive)))
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def port(self):
+        return self._server.server_address[1]
+
+    def url(self, page):
+        """
+        Returns the local URL of a page, e.g. www.google.com or
+        https://www.google.com/search, pages without host are left alone.
+        """
+        if ":" in page and "//" not in page:
+            return page  # e.g. about:blank
+
+        parts = urlsplit(page if "//" in page else "//" + page)
+
+        if not parts.hostname:
+            return page
+
+        self._hosts.add(parts.hostname)
+        return "http://127.0.0.1:{}/{}{}".format(self.port(), parts.hostname, parts.path or "/") + \
+            ("?" + parts.query if parts.query else "")
+
+    def respond(self, method, path, referer, headers):
+        """
+        Returns the status, headers and body of the response to a request of
+        the local path.
+        """
+        host, _, rest = path.lstrip("/").partition("/")
+
+        # a root-relative URL the rewriting missed, e.g. built by a script
+        if host not in self._hosts and referer:
+            referer_path = urlsplit(referer).path.lstrip("/")
+            host, rest = referer_path.split("/")[0], path.lstrip("/")
+
+        key = "//{}/{}".format(host, rest)
+        response = self.archive.get(method, key)
+
+        if response is None and self.mode == "record":
+            response = self._fetch(method, host, rest, headers)
+
+            if response is not None:
+                self.archive.put(method, key, *response)
+
+        if response is None:
+            return 404, [["Content-Type", "text/plain"]], b"Not recorded"
+
+        status, response_headers, body = response
+        content_type = next((value for name, value in response_headers if name.lower() == "content-type"), "")
+
+        if any(text_type in content_type for text_type in self._text_types):
+            body = self._rewrite(body, host)
+
+        return status, response_headers, body
+
+    def _fetch(self, method, host, rest, headers):
+        error = None
+
+        for scheme in ("https", "http"):
+            request = urllib.request.Request("{}://{}/{}".format(scheme, host, rest), method=method,
+                                             headers={name: value for name, value in headers.items()
+                                                      if name.lower() in ("user-agent", "accept", "accept-language")})
+
+            try:
+                with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                    return response.status, self._filter(response.getheaders()), response.read()
+            except urllib.error.HTTPError as e:
+                return e.code, self._filter(e.headers.items()), e.read()
+            except (urllib.error.URLError, OSError) as e:
+                error = e
+
+        print("Warning: {}/{} could not be recorded: {}".format(host, rest, error))
+        return None
+
+    def _filter(self, headers):
+        return [[name, value] for name, value in headers if name.lower() not in self._dropped_headers]
+
+    def _rewrite(self, body, host):
+        local = "http://127.0.0.1:{}/".format(self.port()).encode()
+        body = self._absolute.sub(lambda match: self._local(local, match.group(1)), body)
+        return self._root_relative.sub(lambda match: match.group(1) + b"/" + host.encode() + b"/", body)
+
+    def _local(self, local, host):
+        self._hosts.add(host.decode().lower())
+        return local + host
+
+    @staticmethod
+    def _handler(server):
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self):
+                status, headers, body = server.respond(self.command, self.path, self.headers.get("Referer"), self.headers)
+                self.send_response(status)
+
+                for name, value in headers:
+                    self.send_header(name, value)
+
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_HEAD = do_POST = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record or replay pages on a local HTTP server",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("mode", help="Record missing responses from the live sites, or only replay", choices=["record", "replay"])
+    parser.add_argument("-d", "--directory", help="Directory of the recorded responses", default="replay")
+    parser.add_argument("-p", "--port", help="Port of the server", default=8080, type=int)
+    parser.add_argument("pages", help="Pages to print the local URLs of", nargs="*")
+
+    args = parser.parse_args()
+    server = ReplayServer(args.directory, args.mode, args.port).start()
+
+    for page in args.pages:
+        print(server.url(page))
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import subprocess
+
+
+class CollectorTimeout(Exception):
+    pass
+
+
+class Runtime:
+    """
+    Runs the collectors' tools as direct subprocesses of a single asyncio
+    event loop, hosted by a thread of the harness. Every tool gets a deadline,
+    its duration plus a grace period, after which it is killed and reported
+    as hung. Tools of collectors sharing a measurement window run concurrently
+    on the same loop.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="collector-runtime", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def get():
+        with Runtime._lock:
+            if Runtime._instance is None:
+                Runtime._instance = Runtime()
+
+            return Runtime._instance
+
+    def spawn(self, cmd, timeout, stdout=None):
+        """
+        Starts cmd, with its output redirected to the stdout path if given, and
+        returns a future of its exit code. The future raises CollectorTimeout
+        if the tool didn't exit within timeout seconds.
+        """
+        return asyncio.run_coroutine_threadsafe(self._run(cmd, timeout, stdout), self._loop)
+
+    @staticmethod
+    def wait(future):
+        return future.result()
+
+    async def _run(self, cmd, timeout, stdout):
+        out = open(stdout, "wb") if stdout else subprocess.DEVNULL
+
+        try:
+            process = await asyncio.create_subprocess_exec(*cmd, stdout=out, stderr=subprocess.DEVNULL)
+
+            try:
+                return await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise CollectorTimeout("{} did not exit within {} s and was killed".format(cmd[0], timeout))
+        finally:
+            if stdout:
+                out.close()
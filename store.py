@@ -0,0 +1,231 @@
+import os
+import json
+import time
+import uuid
+import argparse
+import platform
+import numpy
+
+from urllib.parse import quote, unquote
+from pandas import DataFrame, concat
+
+
+class ResultStore:
+    """
+    Append-only store of the results of all runs. Every run gets its own
+    directory with its metadata, and its rows are written in column-oriented
+    partitions by OS and browser build:
+
+        <directory>/run=<id>/run.json
+        <directory>/run=<id>/os=<os>/build=<build>/part-<n>.npz
+
+    Other tables of a run, e.g. the rows of every iteration, are partitioned
+    the same way in <directory>/run=<id>/<table>/.
+
+    Every column of a partition is a separate array of the .npz file, so that
+    reads only load the columns they ask for. Existing partitions are never
+    rewritten, appending adds a new part file.
+    """
+
+    key_columns = ["OS", "Build", "Page", "Browser"]
+
+    def __init__(self, directory):
+        self._directory = directory
+
+    def begin_run(self, config_id, collectors, args=None, run=None):
+        """
+        Creates a new run and returns its id. collectors maps the collectors
+        of the run to their versions.
+        """
+        run = run or ResultStore.run_id()
+        metadata = {"run": run, "config": config_id, "collectors": collectors, "host": platform.node(),
+                    "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "finished": None,
+                    "args": args or {}}
+
+        os.makedirs(self._path(run))
+        self._save(run, metadata)
+        return run
+
+    @staticmethod
+    def run_id():
+        return "{}-{}".format(time.strftime("%Y%m%dT%H%M%S"), uuid.uuid4().hex[:6])
+
+    def end_run(self, run):
+        """
+        Marks run as completed, once all its rows are appended.
+        """
+        metadata = self.get_run(run)
+        metadata["finished"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+        self._save(run, metadata)
+
+    def get_run(self, run):
+        with open(os.path.join(self._path(run), "run.json")) as f:
+            return json.load(f)
+
+    def runs(self, completed=False):
+        """
+        Returns the metadata of all runs, oldest first, or only of the ones
+        which were ended with end_run.
+        """
+        if not os.path.isdir(self._directory):
+            return []
+
+        names = sorted(name for name in os.listdir(self._directory) if name.startswith("run="))
+        runs = [self.get_run(unquote(name[4:])) for name in names]
+        return [run for run in runs if run["finished"]] if completed else runs
+
+    def append(self, run, df, table=None):
+        """
+        Adds the rows of df to run, one new part per (OS, build) partition.
+        """
+        df = df.copy()
+
+        for column in ("OS", "Build"):
+            if column not in df:
+                df[column] = ""
+
+        for (os_name, build), rows in df.groupby(["OS", "Build"]):
+            directory = self._path(run, os_name, build, table)
+            os.makedirs(directory, exist_ok=True)
+
+            parts = [name for name in os.listdir(directory) if name.startswith("part-")]
+            path = os.path.join(directory, "part-{:05d}.npz".format(len(parts)))
+            columns = [column for column in rows.columns if column not in ("OS", "Build")]
+            arrays = {"c{}".format(i): ResultStore._to_array(rows[column]) for i, column in enumerate(columns)}
+
+            # written aside and renamed, readers never see a partial part
+            with open(path + ".tmp", "wb") as f:
+                numpy.savez(f, columns=numpy.array(columns, dtype=str), **arrays)
+
+            os.replace(path + ".tmp", path)
+
+    def read(self, runs=None, systems=None, builds=None, pages=None, browsers=None, metrics=None, table=None):
+        """
+        Returns the rows matching all the given filters, each of them a list of
+        accepted values, as a DataFrame with a Run column. Partitions outside
+        of the runs, OSes and builds requested are not opened at all and only
+        the requested metrics are loaded.
+        """
+        frames = []
+
+        for run, os_name, build, path in self._parts(table):
+            if (runs and run not in runs) or (systems and os_name not in systems) or (builds and build not in builds):
+                continue
+
+            frame = ResultStore._read_part(path, pages, browsers, metrics)
+
+            if len(frame):
+                frame["OS"] = os_name
+                frame["Build"] = build
+                frame["Run"] = run
+                frames.append(frame)
+
+        if not frames:
+            return DataFrame()
+
+        return concat(frames, ignore_index=True)
+
+    def export(self, path, **filters):
+        """
+        Writes the matching rows to path in the layout of the csv report.
+        """
+        df = self.read(**filters)
+
+        if len(df) and len(df["Run"].unique()) == 1:
+            del df["Run"]
+
+        df.to_csv(path, float_format="%.3f")
+        return df
+
+    def _parts(self, table=None):
+        for run in self.runs():
+            run_dir = os.path.join(self._path(run["run"]), table or "")
+
+            if not os.path.isdir(run_dir):
+                continue
+
+            for os_dir in sorted(os.listdir(run_dir)):
+                if not os_dir.startswith("os="):
+                    continue
+
+                for build_dir in sorted(os.listdir(os.path.join(run_dir, os_dir))):
+                    directory = os.path.join(run_dir, os_dir, build_dir)
+
+                    for name in sorted(os.listdir(directory)):
+                        if name.endswith(".npz"):
+                            yield run["run"], unquote(os_dir[3:]), unquote(build_dir[6:]), os.path.join(directory, name)
+
+    @staticmethod
+    def _read_part(path, pages, browsers, metrics):
+        with numpy.load(path) as data:
+            columns = list(data["columns"])
+            index = {column: "c{}".format(i) for i, column in enumerate(columns)}
+            mask = None
+
+            for column, accepted in (("Page", pages), ("Browser", browsers)):
+                if accepted and column in index:
+                    match = numpy.isin(data[index[column]], accepted)
+                    mask = match if mask is None else mask & match
+
+            selected = [column for column in columns if not metrics or column in metrics or column in ResultStore.key_columns]
+            frame = DataFrame({column: data[index[column]] if mask is None else data[index[column]][mask]
+                               for column in selected})
+
+        return frame[selected]
+
+    @staticmethod
+    def _to_array(series):
+        values = series.values
+
+        try:
+            return values.astype(float)
+        except (TypeError, ValueError):
+            return numpy.array(["" if value is None or value != value else str(value) for value in values], dtype=str)
+
+    def _path(self, run, os_name=None, build=None, table=None):
+        path = os.path.join(self._directory, "run=" + quote(run, safe=""))
+
+        if os_name is not None:
+            path = os.path.join(path, table or "", "os=" + quote(os_name, safe=""), "build=" + quote(str(build), safe=""))
+
+        return path
+
+    def _save(self, run, metadata):
+        path = os.path.join(self._path(run), "run.json")
+
+        with open(path + ".tmp", "w") as f:
+            json.dump(metadata, f, indent=4)
+
+        os.replace(path + ".tmp", path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the results store",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("-s", "--store", help="Directory of the results store", default="results")
+    parser.add_argument("-l", "--list", help="List the runs of the store", action="store_true")
+    parser.add_argument("-o", "--output", help="Path of the csv export", default="report.csv")
+    parser.add_argument("--run", help="Runs to export, defaults to the latest completed one, \"all\" for every run", nargs="+", default=None)
+    parser.add_argument("--os", help="OSes to export", nargs="+", default=None)
+    parser.add_argument("--build", help="Browser builds to export", nargs="+", default=None)
+    parser.add_argument("--page", help="Pages to export", nargs="+", default=None)
+    parser.add_argument("--browser", help="Browsers to export", nargs="+", default=None)
+    parser.add_argument("--metric", help="Metrics to export", nargs="+", default=None)
+
+    args = parser.parse_args()
+    store = ResultStore(args.store)
+    runs = store.runs()
+
+    if args.list:
+        for run in runs:
+            print("{run}  {started}  {host}  config {config}  {collectors}{}".format("" if run["finished"] else "  (unfinished)", **run))
+    elif not args.run and not any(run["finished"] for run in runs):
+        print("Warning: no completed runs in {}".format(args.store))
+    else:
+        # a run still in progress, or interrupted, isn't picked by default
+        completed = [run for run in runs if run["finished"]]
+        selected = None if args.run == ["all"] else (args.run or [completed[-1]["run"]])
+        df = store.export(args.output, runs=selected, systems=args.os, builds=args.build, pages=args.page,
+                          browsers=args.browser, metrics=args.metric)
+        print("Exported {} row(s) to {}".format(len(df), args.output))
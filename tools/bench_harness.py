@@ -0,0 +1,324 @@
+"""
+Benchmarks of the harness's own post-processing: the parsers of the tools'
+logs, the aggregation of the iterations and the dispatcher's handling of the
+workers' results. Every stage runs on synthetic inputs of growing size,
+generated from a fixed seed, and reports its time, throughput and peak
+memory, e.g.
+
+    python3 tools/bench_harness.py --save        # records the baseline
+    python3 tools/bench_harness.py               # compares against it
+
+Stages slower or hungrier than the baseline by more than --tolerance are
+reported as regressions and make the script exit with status 1.
+"""
+
+import os
+import io
+import sys
+import time
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import contextlib
+import collections
+import numpy
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import protocol
+
+from pandas import DataFrame
+from wrapper import Wrapper
+from dispatcher import Dispatcher
+from wrappers.PowerGadget import PowerGadget
+from wrappers.IPPET import IPPET
+from wrappers.BLA import BLA
+
+_seed = 0
+_bla_power = "Power Impact (W) - HuronRiver - Sandybridge - Dual Core"
+_metrics = ["Processor Watt", "Processor Joules", "IA Watt", "IA Joules", "CPU % (Platform)", "CPU Proc % (Platform)",
+            "Idle Wakeups", "Idle Proc Wakeups"]
+
+
+def powergadget(size, directory):
+    """
+    A PowerGadget log of size samples.
+    """
+    random = numpy.random.RandomState(_seed)
+    path = os.path.join(directory, "PowerLog.ipg")
+    power = random.uniform(2, 20, (size, 2))
+    energy = numpy.cumsum(power, axis=0) * 0.1
+    elapsed = numpy.arange(1, size + 1) * 0.1
+
+    with open(path, "w") as f:
+        f.write("System Time,RDTSC,Elapsed Time (sec),CPU Utilization(%),CPU Frequency_0(MHz),Processor Power_0(Watt),"
+                "Cumulative Processor Energy_0(Joules),Cumulative Processor Energy_0(mWh),IA Frequency_0(MHz),"
+                "IA Power_0(Watt),Cumulative IA Energy_0(Joules),Cumulative IA Energy_0(mWh),Package Temperature_0(C),"
+                "Package Hot_0,CPU Min Temperature_0(C),CPU Max Temperature_0(C)\n")
+
+        for i in range(size):
+            f.write('"12:00:00:{:03d}",{},{:.3f},{:.1f},2600,{:.3f},{:.3f},{:.3f},2600,{:.3f},{:.3f},{:.3f},55,0,50,60\n'.format(
+                    i % 1000, 1000000 + i, elapsed[i], random.uniform(0, 100), power[i, 0], energy[i, 0],
+                    energy[i, 0] / 3.6, power[i, 1], energy[i, 1], energy[i, 1] / 3.6))
+
+        f.write("\nTotal Elapsed Time (sec) = {:.3f}\nMeasured RDTSC Frequency (GHz) = 2.600\n"
+                "Cumulative Processor Energy_0 (Joules) = {:.3f}\nAverage Processor Power_0 (Watt) = {:.3f}\n"
+                "Cumulative IA Energy_0 (Joules) = {:.3f}\nAverage IA Power_0 (Watt) = {:.3f}\n".format(
+                elapsed[-1], energy[-1, 0], power[:, 0].mean(), energy[-1, 1], power[:, 1].mean()))
+
+    def run():
+        with open(path) as f:
+            PowerGadget.parse_log(f)
+
+    return run
+
+
+def ippet(size, directory, samples=1000):
+    """
+    An IPPET process log of size processes, at least 3, half of them the
+    browser's, with samples rows.
+    """
+    random = numpy.random.RandomState(_seed)
+    path = os.path.join(directory, "ippet_log_processes.xls")
+    # parse_data rejects logs of fewer than 10 columns, i.e. of 2 processes or less
+    size = max(size, 3)
+    names = ["firefox" if i % 2 else "svchost" for i in range(size)]
+    header = ["Time"] + ["\\\\.\\Process({}_{})\\{}".format(name, i, data_type)
+                         for i, name in enumerate(names) for data_type in IPPET._data_types]
+
+    with open(path, "w") as f:
+        f.write("\t".join('"{}"'.format(column) for column in header) + "\n")
+
+        for i in range(samples):
+            f.write("{}\t{}\n".format(i, "\t".join("{:.4f}".format(value) for value in random.uniform(0, 5, len(header) - 1))))
+
+    parser = IPPET(argparse.Namespace(path=sys.executable), "firefox", "about:blank")
+
+    def run():
+        with open(path) as f:
+            parser.parse_data(f)
+
+    return run
+
+
+def bla(size, directory):
+    """
+    A BLA Active Analysis report of size processes.
+    """
+    random = numpy.random.RandomState(_seed)
+    path = os.path.join(directory, "Active Analysis.csv")
+    df = DataFrame({"Image Name": ["firefox.exe" if i % 3 == 0 else "process{}.exe".format(i) for i in range(size)],
+                    "PID": numpy.arange(size),
+                    "CPU % (Platform)": random.uniform(0, 10, size),
+                    "CPU % (Logical)": random.uniform(0, 40, size),
+                    "CSwitches from Idle": random.randint(0, 10000, size),
+                    "Timer Resolution (ms)": random.uniform(1, 16, size),
+                    _bla_power: random.uniform(0, 2, size)})
+    df.to_csv(path, sep="\t", encoding="utf-16", index=False)
+
+    def run():
+        BLA.parse_analysis(path, "firefox.exe")
+
+    return run
+
+
+def summary(size, directory):
+    """
+    The outlier filter and summary of size iterations.
+    """
+    random = numpy.random.RandomState(_seed)
+    df = DataFrame(random.lognormal(1, 0.3, (size, len(_metrics))), columns=_metrics)
+    wrapper = Wrapper(argparse.Namespace(duration=30))
+
+    def run():
+        wrapper._compute_summary(df)
+
+    return run
+
+
+def gather(size, directory, shard_iterations=0):
+    """
+    The dispatcher receiving the results of size pages, every job leased
+    beforehand. With shard_iterations the results are the partial
+    aggregates of the shards, merged into every cell's summary.
+    """
+    config = os.path.join(directory, "config.json")
+    browsers = [{"name": "Firefox", "path": ""}, {"name": "Chrome", "path": ""}]
+
+    with open(config, "w") as f:
+        json.dump({"Pages": ["www.site{}.com".format(i) for i in range(size)], "Benchmarks": ["ProcStat", "RAPL"],
+                   "OS": {"Linux": browsers}}, f)
+
+    args = argparse.Namespace(config=config, journal=os.path.join(directory, "journal.jsonl"), resume=False,
+                              shard_iterations=shard_iterations, iterations=10, max_iterations=None, target_ci=None,
+                              duration=30, sleep=0, heartbeat=10, lease=60, job_timeout=None)
+    columns = _metrics + [metric + " CI" for metric in _metrics] + ["Iterations", "Duration", "Stop Reason"]
+
+    def run():
+        random = numpy.random.RandomState(_seed)
+        dispatcher = Dispatcher(args)
+        dispatcher._jobs = dispatcher._build_jobs()
+        dispatcher._journal.open()
+        dispatcher._queue = dispatcher._build_queue()
+        messages = []
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            dispatcher._handle(protocol.decode(protocol.hello("bench", "Linux", "bench")))
+
+            for i in range(len(dispatcher._jobs)):
+                dispatcher._handle(protocol.decode(protocol.ready("bench", "Linux")))
+
+        for job_id, lease in dispatcher._leases.items():
+            job = lease["job"]
+
+            if shard_iterations:
+                rows = DataFrame(random.lognormal(1, 0.3, (shard_iterations, len(_metrics))), columns=_metrics)
+                messages.append(protocol.partial("bench", job_id, Wrapper.partial(rows)))
+            else:
+                row = DataFrame([dict(zip(columns, list(random.lognormal(1, 0.3, 2 * len(_metrics))) + [10, 30, "fixed"]),
+                                      Browser=browsers[job["browser"]]["name"], Build="", Page=job["page"], OS="Linux")])
+                messages.append(protocol.result("bench", job_id, row))
+
+        # only the handling of the results is measured
+        if tracemalloc.is_tracing() and hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+
+        for message in messages:
+            dispatcher._handle(protocol.decode(message))
+
+        DataFrame(dispatcher._rows)
+        dispatcher._journal.remove()
+        return time.perf_counter() - start
+
+    return run
+
+
+def gather_shards(size, directory):
+    return gather(size, directory, shard_iterations=2)
+
+
+_stages = collections.OrderedDict([
+    ("powergadget", (powergadget, "samples", [1000, 10000, 100000])),
+    ("ippet", (ippet, "processes", [10, 100, 500])),
+    ("bla", (bla, "processes", [100, 1000, 10000])),
+    ("summary", (summary, "iterations", [10, 100, 1000])),
+    ("gather", (gather, "pages", [100, 1000, 2500])),
+    ("gather_shards", (gather_shards, "pages", [10, 50, 200])),
+])
+
+
+def measure(stage, size, repeat):
+    """
+    Returns the best time of repeat runs of a stage and its peak memory.
+    Stages time themselves when their run returns the elapsed time, e.g. to
+    leave out the setup of the dispatcher.
+    """
+    setup = _stages[stage][0]
+    directory = tempfile.mkdtemp()
+
+    try:
+        run = setup(size, directory)
+        times = []
+
+        # the stages' own warnings, e.g. about outliers, would drown the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(repeat):
+                start = time.perf_counter()
+                elapsed = run()
+                times.append(elapsed if elapsed is not None else time.perf_counter() - start)
+
+            tracemalloc.start()
+            run()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        shutil.rmtree(directory)
+
+    return {"seconds": min(times), "throughput": size / min(times), "peak_mb": peak / 2.**20}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns the (stage, size, metric, ratio) of the measures worse than the
+    baseline by more than tolerance.
+    """
+    regressions = []
+
+    for stage, sizes in results.items():
+        for size, result in sizes.items():
+            reference = baseline.get(stage, {}).get(size)
+
+            if reference is None:
+                continue
+
+            for metric in ["seconds", "peak_mb"]:
+                ratio = result[metric] / reference[metric] if reference[metric] else 1.
+
+                if ratio > 1 + tolerance:
+                    regressions.append((stage, size, metric, ratio))
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the harness's parsers and aggregation",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("stages", help="Stages to run, all by default: " + ", ".join(_stages), nargs="*")
+    parser.add_argument("-r", "--repeat", help="Runs of every stage and size, the best time is kept", default=5, type=int)
+    parser.add_argument("--scale", help="Factor applied to the sizes of all the stages", default=1., type=float)
+    parser.add_argument("-b", "--baseline", help="Path of the baseline", default="bench_baseline.json")
+    parser.add_argument("--save", help="Save the results as the new baseline instead of comparing", action="store_true")
+    parser.add_argument("-t", "--tolerance", help="Relative slowdown or memory growth reported as a regression",
+                        default=0.25, type=float)
+
+    args = parser.parse_args()
+    baseline = {}
+
+    for stage in args.stages:
+        if stage not in _stages:
+            parser.error("unknown stage {}".format(stage))
+
+    results = collections.OrderedDict()
+
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        if baseline.get("machine") != platform.node():
+            print("Warning: the baseline was recorded on {}".format(baseline.get("machine")))
+
+        baseline = baseline["stages"]
+
+    print("{:<14} {:>8} {:<10} {:>10} {:>14} {:>9} {:>9}".format("stage", "size", "unit", "ms", "unit/s", "peak MB", "vs base"))
+
+    for stage in args.stages or _stages:
+        setup, unit, sizes = _stages[stage]
+        results[stage] = collections.OrderedDict()
+
+        for size in sizes:
+            size = max(1, int(size * args.scale))
+            result = results[stage][str(size)] = measure(stage, size, args.repeat)
+            reference = baseline.get(stage, {}).get(str(size))
+            print("{:<14} {:>8} {:<10} {:>10.2f} {:>14.0f} {:>9.1f} {:>9}".format(
+                  stage, size, unit, result["seconds"] * 1000, result["throughput"], result["peak_mb"],
+                  "{:.2f}x".format(result["seconds"] / reference["seconds"]) if reference else "-"))
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": platform.node(), "python": platform.python_version(), "stages": results}, f, indent=4)
+
+        print("Baseline saved to {}".format(args.baseline))
+        sys.exit(0)
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    for stage, size, metric, ratio in regressions:
+        print("Regression: {} at {} {} is {:.2f}x the baseline".format(stage, size, metric, ratio))
+
+    sys.exit(1 if regressions else 0)
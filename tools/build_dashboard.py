@@ -0,0 +1,172 @@
+"""
+Builds the data of the dashboard: for every OS and metric a JSON shard with
+the means, CIs and p-values of all the (page, browser) cells, together with
+the ranking of the pages by p-value, plus a manifest listing the shards.
+
+Every shard's entry in the manifest records the hash of its input data and
+shards whose input didn't change since the last build are not rebuilt.
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import numpy
+import pandas
+
+from scipy import stats
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from store import ResultStore
+
+_dashboard = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dashboard", "data")
+_zero_threshold = 0.001
+
+
+def is_metric(column):
+    return (column not in ("X", "Page", "Browser", "OS", "Build", "Run", "Iterations", "Duration", "Stop Reason",
+                           "Warm-up", "Timeouts") and
+            not column.endswith("CI") and not column.endswith("Impact") and not column.endswith("Joules") and
+            not column.startswith("Harness "))
+
+
+def load(args):
+    if args.input:
+        return pandas.read_csv(args.input, index_col=0)
+
+    store = ResultStore(args.store)
+    runs = store.runs(completed=True)
+
+    if not args.run and not runs:
+        raise Exception("No completed runs in {}".format(args.store))
+
+    return store.read(runs=args.run or [runs[-1]["run"]])
+
+
+def pvalues(mean, ci, n, reference):
+    """
+    Vectorized version of the dashboard's former t-test ranking: for every
+    page, the smallest p-value of the reference browser against any other
+    browser, negated when the other browser has the higher mean.
+    mean and ci are (pages, browsers) arrays, n the iterations per page.
+    """
+    n = n[:, None]
+    sd = numpy.maximum(numpy.sqrt(n) * ci / stats.t.ppf(0.975, n - 1), _zero_threshold)
+    ref_mean, ref_sd = mean[:, reference, None], sd[:, reference, None]
+    df = n - 1
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        p_ref = 2 * stats.t.sf(numpy.abs(mean - ref_mean) / (ref_sd / numpy.sqrt(n)), df)
+        p_other = 2 * stats.t.sf(numpy.abs(ref_mean - mean) / (sd / numpy.sqrt(n)), df)
+
+    pv = numpy.maximum(p_ref, p_other)
+    pv[:, reference] = numpy.nan
+    others = ~numpy.isnan(pv)
+
+    higher = others & (ref_mean >= mean)
+    lower = others & (ref_mean < mean)
+    positive = numpy.where(higher, pv, numpy.inf).min(axis=1)
+    negative = numpy.where(lower, pv, numpy.inf).min(axis=1)
+
+    res = numpy.where(numpy.isfinite(positive), positive, -negative)
+    res[~higher.any(axis=1) & ~lower.any(axis=1)] = numpy.nan
+    return res
+
+
+def ranking(pv, pages):
+    """
+    Orders the pages with positive p-values first, both groups ascending,
+    then by page, pages without a p-value last.
+    """
+    keys = [(numpy.isnan(value), value <= 0, 0 if numpy.isnan(value) else value, page) for value, page in zip(pv, pages)]
+    return sorted(range(len(pages)), key=lambda i: keys[i])
+
+
+def build_shard(df, os_name, metric, pages, browsers):
+    mean = df.pivot(index="Page", columns="Browser", values=metric).reindex(index=pages, columns=browsers)
+    ci_column = metric + " CI"
+    ci = df.pivot(index="Page", columns="Browser", values=ci_column).reindex(index=pages, columns=browsers) \
+        if ci_column in df else mean * 0
+    n = df.groupby("Page")["Iterations"].min().reindex(pages).values.astype(float)
+
+    reference = next((i for i, browser in enumerate(browsers) if browser.startswith("Firefox")), 0)
+    pv = pvalues(mean.values.astype(float), ci.values.astype(float), n, reference)
+
+    return {"os": os_name, "metric": metric,
+            "mean": _to_json(mean.values), "ci": _to_json(ci.values), "pvalues": _to_json(pv),
+            "order": ranking(pv, pages)}
+
+
+def build(df, output, force=False):
+    manifest_path = os.path.join(output, "manifest.json")
+    manifest = {"oses": {}}
+    previous = {}
+    built = 0
+
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path) as f:
+            previous = json.load(f).get("oses", {})
+
+    metrics = [column for column in df.columns if is_metric(column)]
+
+    for os_name, rows in df.groupby("OS"):
+        rows = rows.groupby(["Page", "Browser"]).last().reset_index()  # the latest result of every cell, by page and browser
+        pages = sorted(rows["Page"].unique())
+        browsers = sorted(rows["Browser"].unique())
+        entry = {"pages": pages, "browsers": browsers, "metrics": {}}
+        old = previous.get(os_name, {}).get("metrics", {})
+
+        for metric in metrics:
+            if rows[metric].isnull().all():
+                continue
+
+            columns = ["Page", "Browser", "Iterations", metric] + ([metric + " CI"] if metric + " CI" in rows else [])
+            digest = hashlib.sha1(rows[columns].to_csv(index=False).encode()).hexdigest()
+            path = "{}/{}.json".format(_slug(os_name), _slug(metric))
+
+            if old.get(metric, {}).get("hash") != digest or not os.path.exists(os.path.join(output, path)):
+                _write(os.path.join(output, path), build_shard(rows, os_name, metric, pages, browsers))
+                built += 1
+
+            entry["metrics"][metric] = {"file": path, "hash": digest}
+
+        manifest["oses"][os_name] = entry
+
+    _write(manifest_path, manifest)
+    return built
+
+
+def _slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def _to_json(values):
+    return [_to_json(value) for value in values] if numpy.ndim(values) else \
+        (None if numpy.isnan(values) else round(float(values), 6))
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path + ".tmp", "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+
+    os.replace(path + ".tmp", path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the dashboard data",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("-i", "--input", help="csv report to build from instead of the results store", default=None)
+    parser.add_argument("-s", "--store", help="Directory of the results store", default="results")
+    parser.add_argument("--run", help="Runs of the store to build from, defaults to the latest completed one", nargs="+", default=None)
+    parser.add_argument("-o", "--output", help="Output directory", default=_dashboard)
+    parser.add_argument("-f", "--force", help="Rebuild all the shards", action="store_true")
+
+    args = parser.parse_args()
+    built = build(load(args), args.output, args.force)
+    print("Built {} shard(s) in {}".format(built, args.output))
@@ -0,0 +1,309 @@
+"""
+Load test of the dispatcher: a real Dispatcher on localhost serves simulated
+workers which speak the real worker protocol, ClientBenchmark's, but replace
+the browser and the collectors with a sleep of random duration, crash at a
+given rate and reply with results of a given size, e.g.
+
+    python3 tools/simulate_dispatcher.py -w 200 -j 10000 --job_time 1 --failure_rate 0.01
+
+Workers run as threads of a few worker processes, so that they don't compete
+with the dispatcher for the GIL. A crashed worker stops sending heartbeats,
+its job is requeued once the lease expires and it reconnects under a new
+identity. The report gives the dispatcher's throughput, the latency of the
+job requests (scatter) and of the results (gather), both as the dispatcher's
+service time and as the round trip seen by the workers, its memory growth
+and the makespan against the ideal one. The samples of the dispatcher's
+memory and progress over time are written to a csv file.
+"""
+
+import os
+import sys
+import copy
+import json
+import math
+import time
+import queue
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import contextlib
+import collections
+import multiprocessing
+import numpy
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import protocol
+
+from pandas import DataFrame
+from wrapper import Wrapper
+from benchmark import ClientBenchmark
+from dispatcher import Dispatcher
+
+_message_kinds = {"ready": "scatter", "result": "gather", "partial": "gather"}
+
+
+class SimulatedCrash(BaseException):
+    # not an Exception, a failed job would be reported instead of crashing the worker
+    pass
+
+
+class SimulatedWorker(ClientBenchmark):
+    """
+    Worker whose jobs sleep for a lognormal duration of mean --job_time and
+    coefficient of variation --job_cv, and crash with probability
+    --failure_rate after a random part of it. Round trips of its requests are
+    reported to the latencies queue.
+    """
+
+    def __init__(self, args, latencies):
+        super().__init__(copy.copy(args))
+        self._random = random.Random()
+        self._sigma = math.sqrt(math.log(1 + args.job_cv ** 2))
+        self._mu = math.log(args.job_time) - self._sigma ** 2 / 2
+        self._latencies = latencies
+        self._request = self._client.request
+        self._client.request = self._timed_request
+
+    def close(self):
+        self._client.close()
+        self._context.term()
+
+    def _timed_request(self, msg, *kinds):
+        start = time.time()
+        reply = self._request(msg, *kinds)
+
+        if "job" in kinds:
+            self._latencies.put(("scatter", time.time() - start))
+        elif kinds == ("ack",):
+            self._latencies.put(("gather", time.time() - start))
+
+        return reply
+
+    def _run_iteration(self, df, page, browser):
+        self._work()
+        columns = ["Metric {}".format(i) for i in range(self._args.result_columns)]
+        row = dict(zip(columns, numpy.random.lognormal(1, 0.3, len(columns))))
+        row.update({column + " CI": 0.1 for column in columns})
+        row.update({"Iterations": self._args.iterations, "Duration": self._args.duration, "Stop Reason": "fixed",
+                    "Browser": browser["name"], "Build": "", "Page": page, "OS": platform.system()})
+        return DataFrame([row])
+
+    def _run_shard(self, page, browser, collector, start, stop):
+        self._work()
+        columns = ["Metric {}".format(i) for i in range(self._args.result_columns)]
+        return Wrapper.partial(DataFrame(numpy.random.lognormal(1, 0.3, (stop - start, len(columns))), columns=columns))
+
+    def _work(self):
+        duration = self._random.lognormvariate(self._mu, self._sigma)
+
+        if self._random.random() < self._args.failure_rate:
+            time.sleep(duration * self._random.random())
+            raise SimulatedCrash()
+
+        time.sleep(duration)
+
+
+class InstrumentedDispatcher(Dispatcher):
+    """
+    Dispatcher recording the service time of every message and sampling its
+    memory and progress every --sample_interval seconds.
+    """
+
+    def __init__(self, args):
+        super().__init__(args)
+        self.service = collections.defaultdict(list)
+        self.samples = []
+        self.first_job = None
+        self._sampled = 0
+
+    def run(self):
+        self.started = time.time()
+        df = super().run()
+        self.ended = time.time()
+        self._sample()
+        return df
+
+    def _handle(self, msg):
+        start = time.time()
+        reply = super()._handle(msg)
+        self.service[_message_kinds.get(msg["type"], msg["type"])].append(time.time() - start)
+
+        if self.first_job is None and self._leases:
+            self.first_job = start
+
+        return reply
+
+    def _expire_leases(self):
+        super()._expire_leases()
+
+        if time.time() - self._sampled >= self._args.sample_interval:
+            self._sample()
+
+    def _sample(self):
+        self._sampled = time.time()
+        completed = len(self._done) + len(self._received)
+        self.samples.append({"Time": self._sampled - self.started, "Completed": completed, "RSS (MB)": _rss() / 2.**20,
+                             "Leases": len(self._leases), "Pending": sum(len(jobs) for jobs in self._queue.values())})
+
+
+def _rss():
+    """
+    Returns the resident memory of this process in bytes, or its peak where
+    /proc isn't available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (IOError, OSError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if platform.system() == "Darwin" else 1024)
+
+
+def _run_worker(args, latencies):
+    while True:
+        worker = SimulatedWorker(args, latencies)
+
+        try:
+            worker.log()
+        except SimulatedCrash:
+            latencies.put(("crash", 0))
+            worker.close()  # and reconnect as a new worker
+
+
+def _run_process(args, count, latencies):
+    protocol.port = args.port
+    sys.stdout = open(os.devnull, "w")
+    threads = [threading.Thread(target=_run_worker, args=(args, latencies), daemon=True) for i in range(count)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+
+def _percentiles(values):
+    if not values:
+        return "-"
+
+    p50, p90, p99 = numpy.percentile(values, [50, 90, 99]) * 1000
+    return "p50 {:.2f}, p90 {:.2f}, p99 {:.2f}, max {:.2f} ms ({} messages)".format(p50, p90, p99, max(values) * 1000, len(values))
+
+
+def _drain(latencies, measured, stop):
+    # the workers' queue is emptied as it fills, whatever is buffered in a worker process is lost when it ends
+    while not stop.is_set():
+        try:
+            kind, value = latencies.get(timeout=0.5)
+        except queue.Empty:
+            continue
+
+        measured[kind].append(value)
+
+
+def simulate(args):
+    directory = tempfile.mkdtemp()
+    browsers = [{"name": "Browser {}".format(i), "path": ""} for i in range(args.browsers)]
+    pages = int(math.ceil(args.jobs / float(args.browsers * (args.shards if args.shard_iterations else 1))))
+
+    args.config = os.path.join(directory, "config.json")
+    args.journal = os.path.join(directory, "journal.jsonl")
+    args.iterations = args.shard_iterations * args.shards if args.shard_iterations else args.iterations
+
+    with open(args.config, "w") as f:
+        json.dump({"Pages": ["www.site{}.com".format(i) for i in range(pages)], "Benchmarks": ["Simulated"],
+                   "OS": {platform.system(): browsers}}, f)
+
+    protocol.port = args.port
+    context = multiprocessing.get_context("spawn")
+    latencies = context.Queue()
+    processes = [context.Process(target=_run_process, args=(args, args.workers * (i + 1) // args.processes -
+                                                                  args.workers * i // args.processes, latencies), daemon=True)
+                 for i in range(args.processes)]
+    measured = collections.defaultdict(list)
+    stop = threading.Event()
+    drain = threading.Thread(target=_drain, args=(latencies, measured, stop))
+    drain.start()
+
+    try:
+        with open(args.log, "w") as log, contextlib.redirect_stdout(log):
+            dispatcher = InstrumentedDispatcher(args)
+
+            for process in processes:
+                process.start()
+
+            dispatcher.run()
+    finally:
+        for process in processes:
+            process.terminate()
+
+        stop.set()
+        drain.join()
+        shutil.rmtree(directory)
+
+    return dispatcher, measured
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the dispatcher with simulated workers",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("-w", "--workers", help="Number of simulated workers", default=200, type=int)
+    parser.add_argument("--processes", help="Number of processes running the workers", default=min(8, multiprocessing.cpu_count()), type=int)
+    parser.add_argument("-j", "--jobs", help="Number of jobs", default=10000, type=int)
+    parser.add_argument("--browsers", help="Number of browsers of the simulated configuration", default=2, type=int)
+    parser.add_argument("--job_time", help="Mean duration of a job in s", default=1., type=float)
+    parser.add_argument("--job_cv", help="Coefficient of variation of the job durations", default=0.2, type=float)
+    parser.add_argument("--failure_rate", help="Probability that a worker crashes during a job", default=0., type=float)
+    parser.add_argument("--result_columns", help="Number of metrics of every result", default=20, type=int)
+    parser.add_argument("--shard_iterations", help="Shard the cells into jobs of this many iterations, see benchmark.py", default=0, type=int)
+    parser.add_argument("--shards", help="Number of shards of every cell when sharding", default=5, type=int)
+    parser.add_argument("--iterations", help="Iterations of every cell", default=10, type=int)
+    parser.add_argument("--duration", help="Collection duration reported in the results", default=30, type=int)
+    parser.add_argument("--heartbeat", help="Seconds between worker heartbeats", default=1, type=int)
+    parser.add_argument("--lease", help="Seconds without heartbeat after which a job is requeued", default=5, type=int)
+    parser.add_argument("--job_timeout", help="Seconds after which a job is requeued even if its worker is alive", default=None, type=int)
+    parser.add_argument("--port", help="Port of the simulated dispatcher", default=protocol.port + 1, type=int)
+    parser.add_argument("--sample_interval", help="Seconds between samples of the dispatcher's memory and progress", default=1., type=float)
+    parser.add_argument("--log", help="Path of the dispatcher's log", default="simulation.log")
+    parser.add_argument("-o", "--output", help="Path of the csv of the samples of memory and progress", default="simulation.csv")
+
+    args = parser.parse_args()
+    args.address = "127.0.0.1"
+    args.resume = False
+    args.sleep = 0
+    args.max_iterations = None
+    args.target_ci = None
+    args.report_interval = float("inf")
+    args.processes = max(1, min(args.processes, args.workers))
+
+    dispatcher, measured = simulate(args)
+    samples = DataFrame(dispatcher.samples)
+    samples.to_csv(args.output, index=False, float_format="%.3f")
+
+    # from the first job handed out, the workers' startup excluded
+    makespan = dispatcher.ended - dispatcher.first_job
+    jobs = len(dispatcher._jobs)
+    ideal = jobs * args.job_time / args.workers
+    windows = samples["Completed"].diff() / samples["Time"].diff()
+    growth = (samples["RSS (MB)"].iloc[-1] - samples["RSS (MB)"].iloc[0]) / jobs * 1000
+    lost = sum(worker["lost"] for worker in dispatcher._workers.values())
+
+    print("{} job(s) on {} worker(s) in {:.1f} s, ideal {:.1f} s ({:.0f}% efficiency)".format(
+          jobs, args.workers, makespan, ideal, 100 * ideal / makespan))
+    print("Throughput: {:.1f} job(s)/s overall, {:.1f} job(s)/s peak over {:.0f} s".format(
+          jobs / makespan, windows.max(), args.sample_interval))
+    print("Dispatcher service time")
+    print("  scatter: " + _percentiles(dispatcher.service["scatter"]))
+    print("  gather:  " + _percentiles(dispatcher.service["gather"]))
+    print("  heartbeat: " + _percentiles(dispatcher.service["heartbeat"]))
+    print("Round trip seen by the workers")
+    print("  scatter: " + _percentiles(measured["scatter"]))
+    print("  gather:  " + _percentiles(measured["gather"]))
+    print("Crashes: {}, leases expired: {}".format(len(measured["crash"]), lost))
+    print("Dispatcher memory: {:.1f} MB -> {:.1f} MB ({:+.2f} MB per 1000 jobs)".format(
+          samples["RSS (MB)"].iloc[0], samples["RSS (MB)"].iloc[-1], growth))
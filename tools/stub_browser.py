@@ -0,0 +1,56 @@
+"""
+Stand-in for a browser to try concurrent sessions without real browsers: a
+few processes which each keep a share of a CPU busy and wake up at a given
+rate until they are terminated. Configure it as a browser's path, e.g.
+
+    {"name": "Stub", "path": "python3 tools/stub_browser.py --load 0.5"}
+
+The page the benchmark passes as last argument is ignored.
+"""
+
+import os
+import time
+import signal
+import argparse
+
+
+def work(load, wakeups):
+    period = 1. / wakeups
+
+    while True:
+        start = time.time()
+
+        while time.time() - start < period * load:
+            pass
+
+        time.sleep(max(0, period - (time.time() - start)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub browser burning CPU until terminated",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument("-n", "--processes", help="Number of processes, the first one included", default=2, type=int)
+    parser.add_argument("-l", "--load", help="Share of a CPU every process keeps busy", default=0.25, type=float)
+    parser.add_argument("-w", "--wakeups", help="Wakeups per second of every process", default=100, type=float)
+    parser.add_argument("page", help="Ignored", nargs="?")
+
+    args = parser.parse_args()
+    children = []
+
+    for i in range(args.processes - 1):
+        pid = os.fork()
+
+        if pid == 0:
+            work(args.load, args.wakeups)
+
+        children.append(pid)
+
+    def terminate(signum, frame):
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+        os._exit(0)
+
+    signal.signal(signal.SIGTERM, terminate)
+    work(args.load, args.wakeups)
@@ -0,0 +1,142 @@
+import os
+import time
+import collections
+import numpy
+
+try:
+    import psutil
+except:
+    psutil = None
+
+from wrappers.RAPL import RAPL
+
+
+class Warmup:
+    """
+    Waits for the browser to settle before the measured window starts. In
+    "fixed" mode this is a plain sleep of --sleep seconds. In "steady" mode
+    CPU usage and, where available, package power are sampled every
+    --warmup_interval seconds and the warm-up ends as soon as every signal
+    is stable over a rolling window of --warmup_window seconds, with --sleep
+    as the upper bound.
+    """
+
+    def __init__(self, args):
+        self._args = args
+        self.reason = None
+
+    def wait(self):
+        start = time.time()
+        samplers = Warmup._create_samplers() if self._args.warmup == "steady" else []
+
+        if not samplers:
+            if self._args.warmup == "steady":
+                print("Warning: no CPU or power sampler available, falling back to a fixed warm-up")
+
+            time.sleep(self._args.sleep)
+            self.reason = "fixed"
+            return time.time() - start
+
+        length = max(2, int(round(self._args.warmup_window / self._args.warmup_interval)))
+        windows = [collections.deque(maxlen=length) for sampler in samplers]
+
+        for sampler in samplers:
+            sampler.sample()  # prime the counters
+
+        self.reason = "timeout"
+        while time.time() - start + self._args.warmup_interval <= self._args.sleep:
+            time.sleep(self._args.warmup_interval)
+
+            for sampler, window in zip(samplers, windows):
+                window.append(sampler.sample())
+
+            if all(self._is_stable(window, sampler.floor) for sampler, window in zip(samplers, windows)):
+                self.reason = "steady"
+                break
+
+        elapsed = time.time() - start
+        print("Warm-up ended after {:.0f} s ({})".format(elapsed, self.reason))
+        return elapsed
+
+    def _is_stable(self, window, floor):
+        if len(window) < window.maxlen:
+            return False
+
+        values = numpy.array(window)
+        return values.std() <= self._args.warmup_threshold * max(abs(values.mean()), floor)
+
+    @staticmethod
+    def _create_samplers():
+        samplers = []
+
+        if os.path.exists("/proc/stat"):
+            samplers.append(ProcStatSampler())
+        elif psutil is not None:
+            samplers.append(PsutilSampler())
+
+        if PowercapSampler.zones():
+            samplers.append(PowercapSampler())
+
+        return samplers
+
+
+class ProcStatSampler:
+    """
+    Machine-wide CPU usage in percent from /proc/stat.
+    """
+
+    floor = 1.
+
+    def __init__(self, root="/proc"):
+        self._path = os.path.join(root, "stat")
+        self._last = None
+
+    def sample(self):
+        with open(self._path) as f:
+            fields = [int(x) for x in f.readline().split()[1:]]
+
+        busy, total = sum(fields) - fields[3] - fields[4], sum(fields)  # minus idle and iowait
+        last, self._last = self._last, (busy, total)
+
+        if last is None or total == last[1]:
+            return 0.
+
+        return 100. * (busy - last[0]) / (total - last[1])
+
+
+class PsutilSampler:
+    """
+    Machine-wide CPU usage in percent, on platforms without /proc.
+    """
+
+    floor = 1.
+
+    def sample(self):
+        return psutil.cpu_percent(interval=None)
+
+
+class PowercapSampler:
+    """
+    Package power in Watt from the Linux powercap energy counters.
+    """
+
+    floor = 0.1
+
+    def __init__(self, root="/sys/class/powercap"):
+        self._zones = PowercapSampler.zones(root)
+        self._last = None
+
+    @staticmethod
+    def zones(root="/sys/class/powercap"):
+        return [zone for zone in RAPL.find_zones(root)
+                if zone[0] == "Processor" and os.access(os.path.join(zone[1], "energy_uj"), os.R_OK)]
+
+    def sample(self):
+        now = time.time()
+        counters = RAPL.read_zones(self._zones)
+        last, self._last = self._last, (now, counters)
+
+        if last is None:
+            return 0.
+
+        return RAPL.energy(self._zones, [last[1], counters]).sum() / (now - last[0])
@@ -1,34 +1,194 @@
+import math
+import pandas
+import platform
+
 from pandas import DataFrame
 from scipy import stats
+from overhead import Overhead
+from runtime import CollectorTimeout
+from archive import Archive
 
 class Wrapper:
+    _convergence_fields = []
+    _exclusive = False  # set by collectors which can't share a measurement window
+    _package_level = False  # set by collectors measuring the whole package, which can't run in concurrent sessions
+
     def __init__(self, args):
         self._args = args
+        self._overhead = Overhead()
+        self.samples = {}
 
     def log(self):
         df = DataFrame(columns=self._fields)
+        targets = self._get_targets()
+        self.stop_reason = "max_iterations" if targets else "fixed"
+        timeouts = 0
 
-        for i in range(0, self._args.iterations):
+        for i in range(0, self._get_max_iterations()):
             self.current_iteration = i  # allows for proper interval-file naming
+
+            try:
+                df = self._run_iteration(df)
+            except CollectorTimeout as e:
+                print("Warning: iteration {} dropped, {}".format(i, e))
+                timeouts += 1
+                continue
+
+            if targets and i + 1 >= self._args.min_iterations and self._has_converged(df, targets):
+                self.stop_reason = "converged"
+                break
+
+        self.iterations = df
+
+        with self._overhead.span("Summarise"):
+            summary = self._compute_summary(df)
+
+        for key, value in self._overhead.pop_spans().items():
+            summary[key] = value
+
+        summary["Timeouts"] = timeouts
+        return summary
+
+    def log_partial(self, start, stop):
+        """
+        Runs the iterations [start, stop) of a sharded job and returns their
+        raw rows, to be aggregated with Wrapper.partial.
+        """
+        df = DataFrame(columns=self._fields)
+        self.stop_reason = "sharded"
+
+        for i in range(start, stop):
+            self.current_iteration = i
             df = self._run_iteration(df)
 
-        return self._compute_summary(df)
+        return df
 
-    def _compute_summary(self, df):
-        df = df.convert_objects(convert_numeric=True)
-        df, nfiltered = self._filter_outliers(df)
+    def _get_targets(self):
+        """
+        Returns the relative CI half-width to reach for each metric of this
+        collector, or None when the number of iterations is fixed. A "*" entry
+        applies to all the metrics the collector uses to judge convergence.
+        """
+        targets = getattr(self._args, "target_ci", None)
+
+        if not targets:
+            return None
+
+        res = {field: targets["*"] for field in self._convergence_fields} if "*" in targets else {}
+        res.update({key: value for key, value in targets.items() if key in self._fields})
+        return res
+
+    def _get_max_iterations(self):
+        if self._get_targets() and getattr(self._args, "max_iterations", None):
+            return self._args.max_iterations
 
-        summary = df.mean().to_dict()
-        cis = df.apply(lambda x: stats.sem(x, ddof=1) * stats.t.ppf((1.95)/2., len(x) - 1)).to_dict()
+        return self._args.iterations
 
-        for key, value in cis.items():
-            summary[key + " CI"] = value
+    def _has_converged(self, df, targets):
+        df = df.apply(pandas.to_numeric, errors="coerce")
+        df, nfiltered = self._filter_outliers(df, verbose=False)
 
-        summary["Iterations"] = self._args.iterations - nfiltered
-        summary["Duration"] = self._args.duration
+        if len(df) < 2:
+            return False
+
+        evaluated = 0
+
+        for key, target in targets.items():
+            if key not in df:
+                continue
+
+            series = df[key]
+            evaluated += 1
+
+            # the CI of a metric with missing values is unknown
+            if series.isnull().any():
+                return False
+
+            mean = abs(series.mean())
+            ci = Wrapper._confidence_interval(series)
+
+            if mean == 0 and ci == 0:
+                continue
+
+            if mean == 0 or ci / mean > target:
+                return False
+
+        # none of the targeted metrics was collected, there is nothing to stop on
+        return evaluated > 0
+
+    def _compute_summary(self, df):
+        summary = Wrapper.summarize(Wrapper.partial(df), self._args.duration, getattr(self, "stop_reason", "fixed"))
         return DataFrame(summary, index=[0])
 
-    def _filter_outliers(self, df):
+    @staticmethod
+    def partial(df):
+        """
+        Returns the mergeable aggregate of a set of iterations: the count, mean
+        and sum of squared deviations (M2) of every metric, plus the raw rows
+        which the outlier filter needs.
+        """
+        df = df.apply(pandas.to_numeric, errors="coerce")
+        mean = df.mean()
+        return {"count": df.count().to_dict(), "mean": mean.to_dict(),
+                "m2": ((df - mean) ** 2).sum().to_dict(), "rows": df.to_dict("records")}
+
+    @staticmethod
+    def merge(a, b):
+        """
+        Merges two partial aggregates with Chan et al.'s pairwise update.
+        """
+        res = {"count": {}, "mean": {}, "m2": {}, "rows": a["rows"] + b["rows"]}
+
+        for key in list(a["count"]) + [key for key in b["count"] if key not in a["count"]]:
+            na, nb = a["count"].get(key, 0), b["count"].get(key, 0)
+
+            if na == 0 or nb == 0:
+                src = a if nb == 0 else b
+                res["count"][key], res["mean"][key], res["m2"][key] = na + nb, src["mean"][key], src["m2"][key]
+                continue
+
+            n = na + nb
+            delta = b["mean"][key] - a["mean"][key]
+            res["count"][key] = n
+            res["mean"][key] = a["mean"][key] + delta * nb / n
+            res["m2"][key] = a["m2"][key] + b["m2"][key] + delta ** 2 * na * nb / n
+
+        return res
+
+    @staticmethod
+    def summarize(partial, duration, stop_reason="fixed"):
+        """
+        Computes the means and CIs of a (possibly merged) partial aggregate.
+        The moments are only recomputed when the outlier filter drops rows.
+        """
+        df = DataFrame(partial["rows"], columns=list(partial["count"].keys()))
+        iterations = len(df)
+        df, nfiltered = Wrapper._filter_outliers(df)
+
+        if nfiltered:
+            partial = Wrapper.partial(df)
+
+        summary = {}
+        for key, count in partial["count"].items():
+            summary[key] = partial["mean"][key] if count else float("nan")
+
+            # as scipy's sem, missing values propagate to the CI
+            if count == len(df) and count > 1:
+                summary[key + " CI"] = math.sqrt(partial["m2"][key] / (count - 1) / count) * stats.t.ppf((1.95)/2., count - 1)
+            else:
+                summary[key + " CI"] = float("nan")
+
+        summary["Iterations"] = iterations - nfiltered
+        summary["Duration"] = duration
+        summary["Stop Reason"] = stop_reason
+        return summary
+
+    @staticmethod
+    def _confidence_interval(x):
+        return stats.sem(x, ddof=1) * stats.t.ppf((1.95)/2., len(x) - 1)
+
+    @staticmethod
+    def _filter_outliers(df, verbose=True):
         length = len(df)
 
         if length <= 1:
@@ -37,18 +197,108 @@ class Wrapper:
         for c in df.columns:
             series = df[c]
 
-            if series.isnull().any():
+            if series.isnull().any() or str(c).startswith(Overhead.prefix):
                 continue
 
-            # SD is not robust
-            df = df[(series >= series.median() - series.mad()*5) & (series <= series.median() + series.mad()*5)]
+            # SD is not robust, mad is the mean absolute deviation of the removed Series.mad
+            mad = (series - series.mean()).abs().mean()
+            df = df[(series >= series.median() - mad*5) & (series <= series.median() + mad*5)]
 
-        if length != len(df):
+        if length != len(df) and verbose:
             print("Warning: {} outlier(s) removed.".format(length - len(df)))
 
         return df, length - len(df)
 
     def _run_iteration(self, df):
-        self.start()
-        summary = self.join()
+        usage = Overhead.usage()
+
+        with self._overhead.span("Capture"):
+            self.start()
+            summary = self.join()
+
+        if getattr(self._args, "collect_interval", False):
+            with self._overhead.span("Archive"):
+                self._archive_series(Archive(self._args.archive_dir))
+
+        summary.update(Overhead.delta(usage))
+        summary.update(self._overhead.pop_spans())
         return df.append(summary, ignore_index=True)
+
+    def get_name(self):
+        return type(self).__name__
+
+    def get_names(self):
+        return [self.get_name()]
+
+    def get_series(self):
+        """
+        Returns the per-sample series of the last iteration by name.
+        """
+        return self.samples
+
+    def _archive_series(self, archive):
+        key = (getattr(self._args, "run", ""), platform.system(), getattr(self._args, "page", ""),
+               getattr(self._args, "browser", ""), self.get_name(), self.current_iteration)
+        archive.append(key, self.get_series())
+
+
+class CollectorGroup(Wrapper):
+    """
+    Runs several collectors in the same measurement window: all of them are
+    started before any of them is joined, and every iteration yields a single
+    row with the fields of all the collectors.
+    """
+
+    def __init__(self, args, collectors):
+        super().__init__(args)
+        self._collectors = collectors
+
+        for collector in collectors:
+            collector._overhead = self._overhead
+
+        self._fields = [field for collector in collectors for field in collector._fields]
+        self._convergence_fields = [field for collector in collectors for field in collector._convergence_fields]
+
+    def start(self):
+        for collector in self._collectors:
+            collector.current_iteration = self.current_iteration
+            collector.start()
+
+    def join(self):
+        entry = {}
+        error = None
+
+        # join every collector, even past a hung or failed one, so none is left running
+        for collector in self._collectors:
+            try:
+                for key, value in collector.join().items():
+                    entry.setdefault(key, value)
+            except Exception as e:
+                error = error or e
+
+        if error:
+            raise error
+
+        return entry
+
+    def get_name(self):
+        return "+".join(collector.get_name() for collector in self._collectors)
+
+    def get_names(self):
+        return [collector.get_name() for collector in self._collectors]
+
+    def _archive_series(self, archive):
+        for collector in self._collectors:
+            collector._archive_series(archive)
+
+    @staticmethod
+    def schedule(collectors, exclusive=[]):
+        """
+        Partitions the collectors in the groups that share a measurement window.
+        Collectors known to interfere with others, either declared exclusive by
+        their class or listed in exclusive, run on their own.
+        """
+        is_exclusive = lambda collector: collector._exclusive or type(collector).__name__ in exclusive
+        shared = [collector for collector in collectors if not is_exclusive(collector)]
+        groups = [CollectorGroup(shared[0]._args, shared)] if len(shared) > 1 else shared
+        return groups + [collector for collector in collectors if is_exclusive(collector)]
@@ -12,10 +12,12 @@ except:
 sys.path.append("..")
 
 from wrapper import Wrapper
+from runtime import Runtime
 from pandas import DataFrame
-from subprocess import Popen, PIPE
 
 class BLA(Wrapper):
+    _convergence_fields = ["CPU % (Platform)", "CPU Proc % (Platform)", "Idle Wakeups", "Idle Proc Wakeups"]
+
     def __init__(self, args):
         super().__init__(args)
         self._process = None
@@ -39,27 +41,44 @@ class BLA(Wrapper):
             raise Exception("Intel Battery Life Analyzer not found")
 
     def start(self):
-        self._process = Popen('{} c sw:{} -o {} > NUL 2>&1'.format(self._tool, self._args.duration, self._directory), shell=True)
+        cmd = [self._tool, "c", "sw:{}".format(self._args.duration), "-o", self._directory]
+        self._process = Runtime.get().spawn(cmd, self._args.duration + self._args.grace)
 
     def join(self):
-        self._process.wait()
+        Runtime.wait(self._process)
         path = os.path.join(self._directory, "Active Analysis.csv")
+
+        with self._overhead.span("Parse"):
+            entry, self.samples = BLA.parse_analysis(path, self._image)
+
+        #TODO
+        shutil.rmtree(self._directory)
+        return entry
+
+    @staticmethod
+    def parse_analysis(path, image=None):
+        """
+        Parses BLA's UTF-16 "Active Analysis" report and returns the summary,
+        restricted to the processes of image if given, and the per-process
+        series.
+        """
         aa_df = pandas.io.parsers.read_csv(path, sep="\t", encoding="utf-16")
 
+        # one sample per process of the analysis
+        samples = {column: aa_df[column].values for column in aa_df.columns if aa_df[column].dtype.kind in "biuf"}
+
         entry = {}
         entry["CPU % (Platform)"] = aa_df['CPU % (Platform)'][0]
         entry["CPU % (Logical)"] = aa_df['CPU % (Logical)'][0]
         entry["Idle Wakeups"] = aa_df['CSwitches from Idle'][0]
         entry["Power Impact"] = aa_df['Power Impact (W) - HuronRiver - Sandybridge - Dual Core'][0]
 
-        if self._image != None:
-            selection = aa_df[aa_df['Image Name'] == self._image]
-            if len(selection > 0):
+        if image != None:
+            selection = aa_df[aa_df['Image Name'] == image]
+            if len(selection) > 0:
                 entry["CPU Proc % (Platform)"] = selection["CPU % (Platform)"].sum()
                 entry["CPU Proc % (Logical)"] = selection["CPU % (Logical)"].sum()
                 entry["Idle Proc Wakeups"] = selection["CSwitches from Idle"].sum()
                 entry["Power Proc Impact"] = selection['Power Impact (W) - HuronRiver - Sandybridge - Dual Core'].sum()
 
-        #TODO
-        shutil.rmtree(self._directory)
-        return entry
+        return entry, samples
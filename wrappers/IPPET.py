@@ -2,10 +2,11 @@ import sys
 import shutil
 import os
 import platform
-import multiprocessing
 import tempfile
+import numpy
 
 from wrapper import Wrapper
+from runtime import Runtime
 
 get_long_path = lambda x: x
 try:
@@ -24,6 +25,12 @@ class IPPET(Wrapper):
     _tot_cpu = "Total CPU Watts"
     _tot_gpu = "Total GPU Watts"
 
+    _convergence_fields = [_tot_cpu, _avg_cpu]
+    _exclusive = True  # its ETW tracing session interferes with the other Intel tools
+    _package_level = True
+
+    _data_types = ["CPU Power W", "GPU Power W", "%GPU", "%CPU"]
+
     def __init__(self, args, browser, page):
         super().__init__(args)
 
@@ -31,6 +38,7 @@ class IPPET(Wrapper):
         self.page = page
         self._fields = [self._tot_cpu, self._tot_gpu, self._avg_gpu, self._avg_cpu]
         self._system = platform.system()
+        self.series = {}
 
         if self._args.path:
             if os.path.exists(self._args.path) and os.access(self._args.path, os.X_OK):
@@ -47,86 +55,91 @@ class IPPET(Wrapper):
 
     def start(self):
         self._logfile = get_long_path(tempfile.mkdtemp()) + "\\"  # logfile specifies directory; ippet file is standard
-        self._log_process = multiprocessing.Process(target=self._start)
-        self._log_process.start()
 
-    def _start(self):
         if self._system == "Windows":
             # 1st: enable_web: set to no
             # 2nd: z: do not zip files
             # 3rd: log_dir; file names are already specified
             # 4th: time_end: time interval for which it will run
 
-            os.system(" {} -enable_web {} -z {} -log_dir {} -time_end {} > NUL 2>&1".format(
-                      self._tool, "n", "n", self._logfile, str(self._args.duration)))
+            cmd = [self._tool, "-enable_web", "n", "-z", "n", "-log_dir", self._logfile, "-time_end", str(self._args.duration)]
+            self._log_process = Runtime.get().spawn(cmd, self._args.duration + self._args.grace)
         else:
             raise Exception("IPPET does not support your operating system")
 
     def join(self):
-        self._log_process.join()
-        return self._parse()
+        Runtime.wait(self._log_process)
+
+        with self._overhead.span("Parse"):
+            return self._parse()
 
     def _parse(self):
         try:
             with open(self._logfile+"ippet_log_processes.xls") as f:  # append standard IPPET file
-                summary = self.parse_data(f.readlines())
+                summary = self.parse_data(f)
 
         except FileNotFoundError:
             raise Exception("IPPET failed to generate a valid logfile")
             return sys.exit(-1)
 
         assert(summary[self._tot_cpu] > 0)
-        if self._args.collect_interval:
-            try:
-                # rename the file to specify the browser
-                src = self._logfile + "\\" + self.browser.replace(" ", "") + str(self.current_iteration) + "_ippet_log_processes.xls"
-                dest = self._args.directory + self.page + "\\"
-                os.rename(self._logfile + "ippet_log_processes.xls", src)
-
-                try:
-                    os.stat(dest)
-                except:
-                    os.mkdir(dest)  # create page-specific directory for data
-
-                shutil.copy(src, dest)  # copy IPPET data to specified directory for future retrieval
-
-            except Exception:
-                raise Exception("IPPET encountered problem during file save.")
-
         shutil.rmtree(self._logfile)  # deletes the data file
         return summary
 
+    def get_series(self):
+        return self.series
+
     def parse_data(self, ippet_data):
         """
-        This method takes the raw IPPET Log Data and returns a
-        list of lists - each being a column from the original input.
+        This method takes the raw IPPET Log Data, an iterable of TSV lines
+        starting with the header, and returns the browser-specific summary.
+        Only the browser's columns are loaded, as NumPy arrays, while the
+        remaining lines are streamed.
         """
-        ippet_data = "".join(ippet_data).replace("\n", "\t").split("\t")  # input is assumed TSV
-
-        data = []
-        column_count = 0
-        column_iterator = 0
-        is_collecting_columns = True
-
-        for entry in ippet_data:
-            if entry and not entry[0].isdigit() and is_collecting_columns:
-                entry = entry.replace("\\\.\\", "").replace("\\", " ").replace('"', "")  # clean column
-                data.append([entry])
-            elif entry and entry[0].isdigit():
-                if is_collecting_columns:
-                    column_count = len(data)
-                    is_collecting_columns = False
-                
-                if self.browser in data[column_iterator % column_count][0]:  # only collect relevant info.
-                    data[column_iterator % column_count].append(float(entry))
-                    
-                column_iterator += 1  # increment for next column entry
+        ippet_data = iter(ippet_data)
+        header = [IPPET._clean_column(entry) for entry in next(ippet_data, "").rstrip("\n").split("\t")]
+        column_count = len(header)
+
+        while column_count and not header[column_count - 1]:
+            column_count -= 1  # trailing tabs
+
+        columns = self.get_browser_columns(header[:column_count])
 
         # here, 10 was chosen arbitrarily but meant to identify invalid files
-        if column_count < 10 or column_iterator == 0 or column_iterator % column_count != 0:
-              raise Exception("Column collection does not match count, the file is assumed invalid.")
+        if column_count < 10:
+            raise Exception("Column collection does not match count, the file is assumed invalid.")
+
+        try:
+            values = numpy.loadtxt(ippet_data, delimiter="\t", usecols=[index for index, data_type in columns] or [0],
+                                   ndmin=2, dtype=float)
+        except (ValueError, IndexError):
+            raise Exception("Column collection does not match count, the file is assumed invalid.")
+
+        if len(values) == 0:
+            raise Exception("Column collection does not match count, the file is assumed invalid.")
+
+        self.series = {header[index]: values[:, i] for i, (index, data_type) in enumerate(columns)}
+        return self.get_browser_process_data([(data_type, values[:, i]) for i, (index, data_type) in enumerate(columns)])
+
+    def get_browser_columns(self, header):
+        """
+        Resolves the header once, returning the index and the metric type of
+        every column that belongs to the current browser.
+        """
+        columns = []
+
+        for index, entry in enumerate(header):
+            if self.browser in entry and ")" in entry:  # IPPET format is used to extract process names
+                data_type = entry[entry.index(')')+2:]  # remove end paren and space
+
+                if data_type in IPPET._data_types:
+                    columns.append((index, data_type))
+
+        return columns
 
-        return self.get_browser_process_data(data)  
+    @staticmethod
+    def _clean_column(entry):
+        return entry.replace("\\\.\\", "").replace("\\", " ").replace('"', "")
 
     def get_browser_process_data(self, data_columns):
         """
@@ -134,17 +147,14 @@ class IPPET(Wrapper):
         """
         browser_data = {self._tot_cpu: 0, self._tot_gpu: 0, self._avg_cpu: 0, self._avg_gpu: 0}
 
-        for column in data_columns:
-            if self.browser in column[0] and len(column) > 1:  # IPPET format is used to extract process names
-                data_type = column[0][column[0].index(')')+2:]  # remove end paren and space
-
-                if data_type == "CPU Power W":
-                    browser_data[self._tot_cpu] += sum(column[1:])
-                elif data_type == "GPU Power W":
-                    browser_data[self._tot_gpu] += sum(column[1:])
-                elif data_type == "%GPU":
-                    browser_data[self._avg_gpu] += 0 if len(column[1:]) == 0 else sum(column[1:]) / len(column[1:])
-                elif data_type == "%CPU":
-                    browser_data[self._avg_cpu] += 0 if len(column[1:]) == 0 else sum(column[1:]) / len(column[1:])
+        for data_type, column in data_columns:
+            if data_type == "CPU Power W":
+                browser_data[self._tot_cpu] += column.sum()
+            elif data_type == "GPU Power W":
+                browser_data[self._tot_gpu] += column.sum()
+            elif data_type == "%GPU":
+                browser_data[self._avg_gpu] += column.mean()
+            elif data_type == "%CPU":
+                browser_data[self._avg_cpu] += column.mean()
 
         return browser_data
@@ -2,14 +2,16 @@ import sys
 import platform
 import shutil
 import os
-import multiprocessing
 import pandas
 import re
 import tempfile
+import itertools
+import numpy
 
 sys.path.append("..")
 
 from wrapper import Wrapper
+from runtime import Runtime
 from pandas import DataFrame
 
 get_long_path = lambda x: x
@@ -24,10 +26,25 @@ class PowerGadget(Wrapper):
     _win_exec = "PowerLog.exe"
     _lin_exec = "power_gadget"
 
+    _convergence_fields = ["Processor Watt"]
+    _package_level = True
+
+    _chunk_lines = 4096
+    _domains = ["Processor", "IA", "GT"]
+
+    # sample columns, e.g. "Processor Power_0(Watt)" or "Cumulative IA Energy_0(Joules)"
+    _sample_regexp = re.compile(r"(?:Cumulative )?(Processor|IA|GT) (Power|Energy)_0 ?\((?:Watt|Joules)\)$")
+    _sample_fields = {(d, k): d + (" Watt" if k == "Power" else " Joules") for d in _domains for k in ["Power", "Energy"]}
+
+    # trailer lines, e.g. "Average Processor Power_0 (Watt) = 5.2"
+    _trailer_regexp = re.compile(r".* (Processor|IA|GT) (Power|Energy)_0 \((?:Watt|Joules)\) = (.*)")
+    _trailer_fields = _sample_fields
+
     def __init__(self, args):
         super().__init__(args)
 
         self._fields = ["Processor Joules", "Processor Watt", "IA Joules", "IA Watt", "GT Joules", "GT Watt"]
+        self.samples = {}
         self._system = platform.system()
 
         if self._args.path:
@@ -56,28 +73,138 @@ class PowerGadget(Wrapper):
     def start(self):
         directory = get_long_path(tempfile.mkdtemp())
         self._logfile = os.path.join(directory, "PowerLog.ipg")
-        self._log_process = multiprocessing.Process(target=self._start)
-        self._log_process.start()
-
-    def _start(self):
-        resolution = self._args.resolution
-        duration = self._args.duration
-
-        if self._system == "Darwin":
-            os.system("{} -resolution {} -duration {} -file {} > /dev/null".format(
-                      self._tool, str(resolution), str(duration), self._logfile))
-        elif self._system == "Linux":
-            os.system("{} -e {} -d {} > {}".format(self._tool, str(resolution),
-                      str(duration), self._logfile))
+        resolution = str(self._args.resolution)
+        duration = str(self._args.duration)
+        timeout = self._args.duration + self._args.grace
+
+        if self._system == "Linux":
+            # the Linux tool logs to stdout
+            cmd = [self._tool, "-e", resolution, "-d", duration]
+            self._log_process = Runtime.get().spawn(cmd, timeout, stdout=self._logfile)
         else:
-            os.system("{} -resolution {} -duration {} -file {} > NUL 2>&1".format(
-                      self._tool, str(resolution), str(duration), self._logfile))
+            cmd = [self._tool, "-resolution", resolution, "-duration", duration, "-file", self._logfile]
+            self._log_process = Runtime.get().spawn(cmd, timeout)
 
     def join(self):
-        self._log_process.join()
-        return self._parse()
+        Runtime.wait(self._log_process)
+
+        with self._overhead.span("Parse"):
+            return self._parse()
 
     def _parse(self):
+        try:
+            with open(self._logfile) as f:
+                summary, self.samples = PowerGadget.parse_log(f)
+
+        except FileNotFoundError:
+            raise Exception("PowerLog failed to generate a valid logfile")
+            return sys.exit(-1)
+
+        assert(summary['Processor Watt'] > 0)
+        #TODO
+        shutil.rmtree(os.path.split(self._logfile)[0])
+        return summary
+
+    @staticmethod
+    def parse_log(f, chunk_lines=_chunk_lines):
+        """
+        Parses a PowerGadget log in a single streaming pass. The sample section
+        is converted chunk by chunk into NumPy arrays, keeping only the elapsed
+        time and the power/energy columns, which are reduced to running sums as
+        they are read. The elapsed time and power series are still kept whole,
+        for the percentiles and the archive, so memory grows with the length of
+        the log, but not with its other columns. A last sample with missing
+        fields, e.g. of a killed tool, is dropped. The trailer is matched
+        against a single combined regexp. Returns the summary and the
+        per-sample series.
+        """
+        line = next(f, "")
+        header = PowerGadget._parse_header(line)
+        width = len(line.split(","))
+        columns = [index for index, name in header]
+        sums = PowerGadget._sums([name for index, name in header])
+        series = {name: [] for index, name in header if name == "Elapsed" or name.endswith(" Watt")}
+
+        while True:
+            lines = list(itertools.islice(f, chunk_lines))
+            end = next((i for i, line in enumerate(lines) if not line.strip()), None)
+            data = lines if end is None else lines[:end]
+
+            # only the last line of the file can be cut short, which may be the last of a full chunk
+            if data and end is None and len(data[-1].split(",")) < width:
+                print("Warning: partial PowerGadget sample dropped")
+                data = data[:-1]
+
+            if data and columns:
+                chunk = numpy.loadtxt([line.replace('"', "") for line in data], delimiter=",",
+                                      usecols=columns, ndmin=2, dtype=float)
+                PowerGadget._accumulate(sums, chunk)
+
+                for i, name in enumerate(sums["names"]):
+                    if name in series:
+                        series[name].append(chunk[:, i])
+
+            if end is not None or len(lines) < chunk_lines:
+                break
+
+        samples = {name: numpy.concatenate(parts) if parts else numpy.empty(0) for name, parts in series.items()}
+
+        trailer = {}
+        for line in itertools.chain(lines[end + 1:] if end is not None else [], f):
+            m = PowerGadget._trailer_regexp.match(line)
+            if m:
+                trailer[PowerGadget._trailer_fields[m.group(1, 2)]] = float(m.group(3))
+
+        return PowerGadget._summarize(samples, trailer, sums), samples
+
+    @staticmethod
+    def _parse_header(line):
+        header = []
+
+        for index, name in enumerate(line.split(",")):
+            name = name.strip().strip('"')
+
+            if name == "Elapsed Time (sec)":
+                header.append((index, "Elapsed"))
+                continue
+
+            m = PowerGadget._sample_regexp.match(name)
+            if m:
+                header.append((index, PowerGadget._sample_fields[m.group(1, 2)]))
+
+        return header
+
+    @staticmethod
+    def _sums(names):
+        """
+        Returns the running count, sums, peaks, energies and last values of the
+        series names, see _accumulate.
+        """
+        return {"names": names, "count": 0, "elapsed": 0., "sum": numpy.zeros(len(names)),
+                "peak": numpy.full(len(names), -numpy.inf), "joules": numpy.zeros(len(names)),
+                "last": numpy.full(len(names), numpy.nan)}
+
+    @staticmethod
+    def _accumulate(sums, chunk):
+        """
+        Adds a chunk of samples, one column per series, to the running sums.
+        The energy of a power series is integrated over the elapsed time,
+        across chunks.
+        """
+        names = sums["names"]
+        sums["count"] += len(chunk)
+        sums["sum"] += chunk.sum(axis=0)
+        sums["peak"] = numpy.maximum(sums["peak"], chunk.max(axis=0))
+        sums["last"] = chunk[-1]
+
+        if "Elapsed" in names:
+            elapsed = chunk[:, names.index("Elapsed")]
+            interval = numpy.diff(numpy.concatenate(([sums["elapsed"]], elapsed)))
+            sums["joules"] += (chunk * interval[:, None]).sum(axis=0)
+            sums["elapsed"] = elapsed[-1]
+
+    @staticmethod
+    def _summarize(samples, trailer, sums=None):
         summary = {"Processor Watt" : 0,
                    "Processor Joules": 0,
                    "IA Watt": float('nan'),
@@ -85,35 +212,29 @@ class PowerGadget(Wrapper):
                    "GT Watt": float('nan'),
                    "GT Joules": float('nan')}
 
-        regexps = {"Processor Watt" : re.compile(".* Processor Power_0 \(Watt\) = (.*)"),
-                   "Processor Joules": re.compile(".* Processor Energy_0 \(Joules\) = (.*)"),
-                   "IA Joules": re.compile(".* IA Energy_0 \(Joules\) = (.*)"),
-                   "IA Watt": re.compile(".* IA Power_0 \(Watt\) = (.*)"),
-                   "GT Joules": re.compile(".* GT Energy_0 \(Joules\) = (.*)"),
-                   "GT Watt": re.compile(".* GT Power_0 \(Watt\) = (.*)")}
+        if sums is None:
+            sums = PowerGadget._sums(list(samples))
 
-        try:
-            with open(self._logfile) as f:
-                lines = f.readlines()
+            if samples and all(len(series) for series in samples.values()):
+                PowerGadget._accumulate(sums, numpy.column_stack(list(samples.values())))
 
-                # split in data and metadata
-                for iteration, line in enumerate(lines):
-                    if line == "\n":
-                        data = lines[:iteration]
-                        metadata = lines[iteration + 1:]
-                        break
+        names = sums["names"]
+        for domain in PowerGadget._domains:
+            name = domain + " Watt"
 
-                for line in metadata:
-                    for key, regexp in regexps.items():
-                        m = re.match(regexp, line)
-                        if m:
-                            summary[key] = float(m.group(1))
+            if name in names and sums["count"]:
+                i = names.index(name)
+                summary[name] = sums["sum"][i] / sums["count"]
+                summary[name + " Median"], summary[name + " P95"] = numpy.percentile(samples[name], [50, 95])
+                summary[name + " Peak"] = sums["peak"][i]
 
-        except FileNotFoundError:
-            raise Exception("PowerLog failed to generate a valid logfile")
-            return sys.exit(-1)
+                if "Elapsed" in names:
+                    summary[domain + " Joules"] = sums["joules"][i]
 
-        assert(summary['Processor Watt'] > 0)
-        #TODO
-        shutil.rmtree(os.path.split(self._logfile)[0])
+            name = domain + " Joules"
+            if name in names and sums["count"]:
+                summary[name] = sums["last"][names.index(name)]
+
+        # the tool's own totals take precedence over the sampled estimates
+        summary.update(trailer)
         return summary
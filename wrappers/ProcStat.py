@@ -0,0 +1,142 @@
+import os
+import sys
+import time
+import threading
+
+sys.path.append("..")
+
+import procfs
+from wrapper import Wrapper
+
+
+class ProcStat(Wrapper):
+    """
+    Linux counterpart of BLA: machine-wide and per-process CPU usage and
+    wakeups from /proc, reported with BLA's field names. The counters are
+    read when the window starts and ends, and the browser's process tree is
+    only rescanned every few seconds to catch new processes, so the collector
+    itself barely wakes up the machine it measures.
+
+    In a concurrent session the browser runs in a cgroup slice of its own:
+    the CPU time and the stalls of all the slice's processes are then taken
+    from its cpu.stat and pressure files, the platform percentages are
+    relative to the slice's CPUs, and the machine-wide fields, shared with
+    the other sessions, are left empty.
+    """
+
+    _convergence_fields = ["CPU % (Platform)", "CPU Proc % (Platform)", "Idle Wakeups", "Idle Proc Wakeups"]
+    _machine_wide = ["CPU % (Platform)", "CPU % (Logical)", "Idle Wakeups"]
+    _rescan_interval = 5
+    _pressure = {"cpu": "CPU Pressure %", "memory": "Memory Pressure %", "io": "IO Pressure %"}
+
+    def __init__(self, args, root="/proc"):
+        super().__init__(args)
+        self._root = root
+        self._ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._fields = ["CPU % (Platform)", "CPU % (Logical)", "CPU Proc % (Platform)",
+                        "CPU Proc % (Logical)", "Idle Wakeups", "Idle Proc Wakeups",
+                        "Power Impact", "Power Proc Impact"]
+        self._cgroup = getattr(args, "cgroup", None)
+
+        if self._cgroup is not None:
+            self._fields += list(self._pressure.values())
+            # left empty in a slice, they would never converge
+            self._convergence_fields = [field for field in self._convergence_fields if field not in self._machine_wide]
+
+        if not os.path.exists(os.path.join(root, "stat")):
+            raise Exception("procfs not found")
+
+    def start(self):
+        self._tasks = {}
+        self._start = time.time()
+        self._system = procfs.cpu_times(self._root), procfs.idle_entries(self._root)
+        self._scan(initial=True)
+
+        if self._cgroup is not None:
+            self._slice = self._read_cgroup()
+
+    def join(self):
+        end = self._start + self._args.duration
+        stop = threading.Event()
+
+        while time.time() < end:
+            stop.wait(min(self._rescan_interval, max(0, end - time.time())))
+            self._scan()
+
+        elapsed = time.time() - self._start
+        (busy, total, ncpus), idle = procfs.cpu_times(self._root), procfs.idle_entries(self._root)
+        (busy0, total0, ncpus0), idle0 = self._system
+
+        entry = {}
+        entry["CPU % (Platform)"] = 100. * (busy - busy0) / (total - total0) if total > total0 else 0.
+        entry["CPU % (Logical)"] = entry["CPU % (Platform)"] * ncpus  # relative to a single logical CPU
+        entry["Idle Wakeups"] = idle - idle0 if idle is not None and idle0 is not None else float("nan")
+        entry["Power Impact"] = float("nan")
+        entry["Power Proc Impact"] = float("nan")
+
+        if self._tasks:
+            cpu = sum(last[0] - first[0] for first, last in self._tasks.values())
+            entry["CPU Proc % (Logical)"] = 100. * cpu / elapsed
+            entry["CPU Proc % (Platform)"] = entry["CPU Proc % (Logical)"] / ncpus
+            entry["Idle Proc Wakeups"] = sum(last[1] - first[1] for first, last in self._tasks.values())
+
+        if self._cgroup is not None:
+            entry.update(self._cgroup_entry(elapsed))
+
+        return entry
+
+    def _read_cgroup(self):
+        """
+        Returns the CPU time of the slice and the time some of its processes
+        stalled on every resource, in us.
+        """
+        stalls = {}
+
+        for resource in self._pressure:
+            pressure = self._cgroup.pressure(resource)
+            stalls[resource] = pressure["some"]["total"] if pressure else None
+
+        return self._cgroup.cpu_stat()["usage_usec"], stalls
+
+    def _cgroup_entry(self, elapsed):
+        (usage, stalls), (usage0, stalls0) = self._read_cgroup(), self._slice
+        entry = {key: float("nan") for key in self._machine_wide}
+
+        entry["CPU Proc % (Logical)"] = 100. * (usage - usage0) / 1e6 / elapsed
+        entry["CPU Proc % (Platform)"] = entry["CPU Proc % (Logical)"] / len(self._cgroup.cpus)
+
+        for resource, field in self._pressure.items():
+            entry[field] = 100. * (stalls[resource] - stalls0[resource]) / 1e6 / elapsed \
+                if stalls[resource] is not None else float("nan")
+
+        return entry
+
+    def _browser_pids(self):
+        if self._cgroup is not None:
+            return self._cgroup.pids()
+
+        pid = getattr(self._args, "browser_pid", None)
+
+        if pid is not None:
+            return procfs.process_tree(pid, self._root)
+
+        if self._args.image:
+            return procfs.find(os.path.splitext(self._args.image)[0], self._root)
+
+        return []
+
+    def _scan(self, initial=False):
+        """
+        Updates the counters of every thread of the browser's processes. Threads
+        first seen after the window started are counted from zero, and the last
+        values of threads which exited are kept.
+        """
+        for pid in self._browser_pids():
+            for tid in procfs.tasks(pid, self._root):
+                try:
+                    counters = procfs.task_counters(pid, tid, self._root, self._ticks)
+                except (IOError, OSError, ValueError, IndexError):
+                    continue  # the thread exited meanwhile
+
+                first = self._tasks[(pid, tid)][0] if (pid, tid) in self._tasks else counters if initial else (0., 0)
+                self._tasks[(pid, tid)] = (first, counters)
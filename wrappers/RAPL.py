@@ -0,0 +1,125 @@
+import os
+import re
+import sys
+import glob
+import time
+import threading
+import numpy
+
+sys.path.append("..")
+
+from wrapper import Wrapper
+from wrappers.PowerGadget import PowerGadget
+
+
+class RAPL(Wrapper):
+    """
+    Reads the RAPL energy counters which Linux exposes through powercap,
+    without spawning any tool. The counters are sampled every --resolution
+    ms from a thread and reported with PowerGadget's field names.
+    """
+
+    _root = "/sys/class/powercap"
+    _convergence_fields = ["Processor Watt"]
+    _package_level = True
+
+    # powercap zone names, e.g. intel-rapl:0 is "package-0" and intel-rapl:0:0 "core"
+    _domains = {"package": "Processor", "core": "IA", "uncore": "GT"}
+
+    def __init__(self, args, root=_root):
+        super().__init__(args)
+
+        self._fields = ["Processor Joules", "Processor Watt", "IA Joules", "IA Watt", "GT Joules", "GT Watt"]
+        self._zones = RAPL.find_zones(root)
+        self.samples = {}
+
+        if not self._zones:
+            raise Exception("RAPL powercap interface not found")
+        if not all(os.access(os.path.join(path, "energy_uj"), os.R_OK) for domain, path, limit in self._zones):
+            raise Exception("RAPL energy counters are not readable, check the permissions of {}".format(root))
+
+    @staticmethod
+    def find_zones(root=_root):
+        """
+        Returns the domain, path and counter range of every RAPL zone.
+        """
+        zones = []
+
+        for path in sorted(glob.glob(os.path.join(root, "intel-rapl:*"))):
+            try:
+                with open(os.path.join(path, "name")) as f:
+                    name = re.sub(r"-\d+$", "", f.read().strip())
+                with open(os.path.join(path, "max_energy_range_uj")) as f:
+                    limit = int(f.read())
+            except (IOError, ValueError):
+                continue
+
+            if name in RAPL._domains:
+                zones.append((RAPL._domains[name], path, limit))
+
+        return zones
+
+    @staticmethod
+    def read_zones(zones):
+        counters = []
+
+        for domain, path, limit in zones:
+            with open(os.path.join(path, "energy_uj")) as f:
+                counters.append(int(f.read()))
+
+        return counters
+
+    @staticmethod
+    def energy(zones, counters):
+        """
+        Returns the Joules consumed by every zone between consecutive rows of
+        counters, accounting for wraparounds.
+        """
+        deltas = numpy.diff(numpy.array(counters, dtype=numpy.int64), axis=0)
+        limits = numpy.array([limit for domain, path, limit in zones], dtype=numpy.int64)
+        deltas = numpy.where(deltas < 0, deltas + limits, deltas)
+        return deltas / 1e6
+
+    def start(self):
+        self._times = []
+        self._counters = []
+        self._thread = threading.Thread(target=self._sample)
+        self._thread.start()
+
+    def _sample(self):
+        interval = self._args.resolution / 1000.
+        start = time.time()
+        stop = threading.Event()
+
+        for i in range(int(round(self._args.duration / interval)) + 1):
+            stop.wait(max(0, start + i * interval - time.time()))
+            self._times.append(time.time())
+            self._counters.append(RAPL.read_zones(self._zones))
+
+    def join(self):
+        self._thread.join()
+
+        with self._overhead.span("Parse"):
+            return self._parse()
+
+    def _parse(self):
+        times = numpy.array(self._times)
+        energy = RAPL.energy(self._zones, self._counters)
+        elapsed = times[1:] - times[0]
+        intervals = numpy.diff(times)
+
+        samples = {"Elapsed": elapsed}
+        totals = {}
+        for domain in set(domain for domain, path, limit in self._zones):
+            columns = [i for i, zone in enumerate(self._zones) if zone[0] == domain]
+            joules = energy[:, columns].sum(axis=1)
+            samples[domain + " Watt"] = joules / intervals
+            samples[domain + " Joules"] = joules.cumsum()
+            totals[domain + " Joules"] = joules.sum()
+            totals[domain + " Watt"] = joules.sum() / elapsed[-1]
+
+        self.samples = samples
+        summary = PowerGadget._summarize(samples, totals)
+
+        assert(summary['Processor Watt'] > 0)
+        return summary